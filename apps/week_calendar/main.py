@@ -8,26 +8,31 @@ BASE_DESIGN_HEIGHT = 800
 DEVICE_NATIVE_WIDTH = 800
 DEVICE_NATIVE_HEIGHT = 480
 
-import copy
+import functools
+import logging
+import os
 import sys
+import time
+from dataclasses import astuple
 from pathlib import Path
-from datetime import date
+from datetime import date, datetime, timedelta
 from typing import Optional
 
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, 
-    QStackedWidget, QDialog
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QDialog
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QTransform
 
+# Sibling packages (models, utils, ...) resolve from the script directory,
+# which Python puts at the front of sys.path when main.py is executed
 from models import CalendarDatabase
 from utils.dummy_data import populate_database_with_dummy_data, populate_weather_cache
+from utils import settings_cache
+from utils.location import prefetch_location, shutdown_location_lookups
 from utils.screentime import ScreenTimeManager
 from widgets.navigation_bar import NavigationBar
+from widgets.lazy_stacked_widget import LazyStackedWidget
 from widgets.settings_dialog import SettingsDialog
 from widgets.screentime_dialog import ScreenTimeQuickActionsDialog
 from views.dashboard_view import DashboardView
@@ -38,9 +43,102 @@ from views.year_view import YearView
 from themes.theme_manager import get_theme_manager, Theme, ThemeColors
 
 
+log = logging.getLogger(__name__)
+
+
+# ThemeFont size fields, smallest to largest
+_FONT_SIZE_FIELDS = (
+    "size_small",
+    "size_normal",
+    "size_large",
+    "size_xlarge",
+    "size_heading",
+    "size_title"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_font_sizes(base_sizes: tuple, font_size: Optional[int],
+                        scale_small: Optional[float], scale_large: Optional[float]) -> tuple:
+    """Apply font size and scale overrides to theme font sizes.
+    
+    Args:
+        base_sizes: Theme font sizes in _FONT_SIZE_FIELDS order
+        font_size: Requested normal font size, or None to keep the theme's
+        scale_small: Extra scale for small fonts (0.5 = +50%), None to skip scaling
+        scale_large: Extra scale for large fonts, None to skip scaling
+        
+    Returns:
+        New font sizes in _FONT_SIZE_FIELDS order
+    """
+    small, normal, large, xlarge, heading, title = base_sizes
+    
+    if font_size is not None:
+        delta = font_size - normal
+        normal = font_size
+        small = max(6, small + delta)
+        large = max(8, large + delta)
+        xlarge = max(10, xlarge + delta)
+        heading = max(12, heading + delta)
+        title = max(14, title + delta)
+    
+    if scale_small is not None and scale_large is not None:
+        # Smaller fonts (menus, labels, etc.)
+        small = max(6, int(small * (1 + scale_small)))
+        # Larger fonts (tiles, icons, headers)
+        large = max(8, int(large * (1 + scale_large)))
+        xlarge = max(10, int(xlarge * (1 + scale_large)))
+        heading = max(12, int(heading * (1 + scale_large)))
+        title = max(14, int(title * (1 + scale_large)))
+    
+    return (small, normal, large, xlarge, heading, title)
+
+
+class DummyDataWorkerSignals(QObject):
+    """Signals emitted by DummyDataWorker (QRunnable cannot emit itself)."""
+    
+    finished = pyqtSignal()
+
+
+class DummyDataWorker(QRunnable):
+    """Populates an empty database with dummy data off the UI thread."""
+    
+    def __init__(self, database):
+        """Initialize worker.
+        
+        Args:
+            database: CalendarDatabase instance to populate
+        """
+        super().__init__()
+        self.database = database
+        self.signals = DummyDataWorkerSignals()
+    
+    def run(self):
+        """Generate entries and weather data, then signal completion."""
+        try:
+            with self.database.bulk_seed():
+                populate_database_with_dummy_data(self.database, weeks=8)
+                populate_weather_cache(self.database, days=30)
+        except Exception as e:
+            log.error("Error populating dummy data: %s", e)
+        finally:
+            self.signals.finished.emit()
+
+
 class WeekCalendarApp(QMainWindow):
     """Main calendar application window."""
     
+    # Emitted (throttled) with the applied theme and resolved icon sizes
+    # ({'tile': ..., 'hero': ..., 'calendar': ...})
+    themeApplied = pyqtSignal(object, dict)
+    
+    # View name -> (signal, slot name) wired up when the view is first built
+    _VIEW_SIGNALS = {
+        "week": ("day_clicked", "_show_day_view"),
+        "month": ("day_clicked", "_show_day_view"),
+        "year": ("month_clicked", "_show_month_view")
+    }
+    
     def __init__(self, windowed: bool = False, scale_factor: float = 1.0):
         """Initialize the calendar app.
         
@@ -54,6 +152,24 @@ class WeekCalendarApp(QMainWindow):
         self.database = CalendarDatabase()
         self.current_date = date.today()
         
+        # Today's date, shared by handlers and rolled over by a midnight timer
+        self._today = self.current_date
+        self._schedule_day_rollover()
+        
+        # Rotation is kept in memory and written through to the database;
+        # rapid taps are collapsed into a single write
+        self._rotation = int(self.database.get_setting('rotation', '0'))
+        self._rotation_save_timer = QTimer(self)
+        self._rotation_save_timer.setSingleShot(True)
+        self._rotation_save_timer.setInterval(500)
+        self._rotation_save_timer.timeout.connect(self._save_rotation)
+        
+        # Keep SQLite planner statistics fresh on the long-lived connection
+        self._db_optimize_timer = QTimer(self)
+        self._db_optimize_timer.setInterval(15 * 60 * 1000)
+        self._db_optimize_timer.timeout.connect(self.database.optimize)
+        self._db_optimize_timer.start()
+        
         # Initialize theme manager
         self.theme_manager = get_theme_manager()
         self.current_theme = None
@@ -61,13 +177,46 @@ class WeekCalendarApp(QMainWindow):
         self.icon_size_override = 64
         self.icon_scale_overrides = {}
         
+        # Theme caches (invalidated whenever settings.json is re-read)
+        self._settings_snapshot: Optional[dict] = None  # Last dict from get_settings()
+        self._theme_cache: dict = {}
+        self._merged_theme_cache: dict = {}
+        self._last_sheet_hash: Optional[int] = None
+        self._current_app_font: Optional[tuple] = None
+        
+        # Coalesce rapid live-preview requests (e.g. slider drags)
+        self._pending_preview: Optional[tuple] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self._apply_pending_preview)
+        
+        # Throttle themeApplied so bursts of applies reach child widgets
+        # at most once per 150ms (leading + trailing emission)
+        self._pending_theme_payload: Optional[tuple] = None
+        self._theme_emit_timer = QTimer(self)
+        self._theme_emit_timer.setSingleShot(True)
+        self._theme_emit_timer.setInterval(150)
+        self._theme_emit_timer.timeout.connect(self._on_theme_emit_timeout)
+        self._theme_flush_armed = False
+        
         # Initialize screen time manager
         self.screentime_manager = ScreenTimeManager(self)
         
+        # Throttle state for screentime display updates
+        self._last_displayed_remaining: Optional[int] = None
+        self._last_display_ts = 0.0
+        self._last_dialog_update_ts = 0.0
+        
         self._init_ui()
         self._apply_display_scaling()
         self._load_and_apply_theme()
-        self._populate_dummy_data_if_needed()
+        self._prefetch_location_if_auto()
+        # Background dummy-data seeding; see closeEvent()
+        self._closing = False
+        self._dummy_data_worker: Optional[DummyDataWorker] = None
+        # Even the emptiness check waits until after the first paint
+        QTimer.singleShot(0, self._populate_dummy_data_if_needed)
         
         # Start screentime after UI is ready
         self.screentime_manager.start()
@@ -93,8 +242,12 @@ class WeekCalendarApp(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
+        # Last resolved icon sizes, used for views created later
+        self._icon_sizes: dict = {}
+        
         # Navigation bar at top
         self.nav_bar = NavigationBar(self)
+        self._subscribe_to_theme(self.nav_bar)
         self.nav_bar.view_changed.connect(self._on_view_changed)
         self.nav_bar.back_clicked.connect(self._on_back_clicked)
         self.nav_bar.settings_clicked.connect(self._on_settings_clicked)
@@ -105,37 +258,35 @@ class WeekCalendarApp(QMainWindow):
         self.quick_actions_dialog = None
         
         # Stacked widget for different views
-        self.view_stack = QStackedWidget()
+        self.view_stack = LazyStackedWidget()
         main_layout.addWidget(self.view_stack)
         
-        # Create all views
+        # Create dashboard eagerly (landing page)
         self.dashboard_view = DashboardView(self.database, scale_factor=self.scale_factor)
-        self.day_view = DayView(self.database, self.current_date)
-        self.week_view = WeekView(self.database, self.current_date)
-        self.month_view = MonthView(self.database, self.current_date)
-        self.year_view = YearView(self.database, self.current_date)
-        
-        # Add views to stack (dashboard first)
         self.view_stack.addWidget(self.dashboard_view)
-        self.view_stack.addWidget(self.day_view)
-        self.view_stack.addWidget(self.week_view)
-        self.view_stack.addWidget(self.month_view)
-        self.view_stack.addWidget(self.year_view)
-        
-        # Connect view navigation signals
+        # Stack indices for cheap "which page is showing" checks
+        self._idx_dashboard = self.view_stack.indexOf(self.dashboard_view)
+        self._idx_settings = -1
         self.dashboard_view.calendar_clicked.connect(self._show_week_view)
-        self.week_view.day_clicked.connect(self._show_day_view)
-        self.month_view.day_clicked.connect(self._show_day_view)
-        self.year_view.month_clicked.connect(self._show_month_view)
+        self._subscribe_to_theme(self.dashboard_view, (
+            ('set_tile_icon_size', 'tile'),
+            ('set_hero_icon_size', 'hero')
+        ))
+        
+        # Calendar views hold placeholder slots until first navigation
+        self.view_stack.widget_created.connect(self._on_view_created)
+        self.view_stack.addLazyWidget("day", lambda: DayView(self.database, self.current_date))
+        self.view_stack.addLazyWidget("week", lambda: WeekView(self.database, self.current_date))
+        self.view_stack.addLazyWidget("month", lambda: MonthView(self.database, self.current_date))
+        self.view_stack.addLazyWidget("year", lambda: YearView(self.database, self.current_date))
         
         # Start with dashboard view
         self.view_stack.setCurrentWidget(self.dashboard_view)
         self.nav_bar.set_active_view(None)  # No view active on dashboard
         
         # Apply saved rotation if any
-        rotation = int(self.database.get_setting('rotation', '0'))
-        if rotation != 0:
-            self._apply_rotation(rotation)
+        if self._rotation != 0:
+            self._apply_rotation(self._rotation)
     
     def _apply_display_scaling(self):
         """Scale UI components to match the target Pi display."""
@@ -165,17 +316,56 @@ class WeekCalendarApp(QMainWindow):
             "calendar_icon_size": max(32, int(48 * scale))
         }
     
+    def _on_view_created(self, name: str, view: QWidget):
+        """Wire up and theme a calendar view the stack just materialized.
+        
+        Args:
+            name: View name ("day", "week", "month", "year")
+            view: The newly built view widget
+        """
+        signal_info = self._VIEW_SIGNALS.get(name)
+        if signal_info:
+            signal_name, slot_name = signal_info
+            getattr(view, signal_name).connect(getattr(self, slot_name))
+        if self.current_theme is not None:
+            view.apply_theme(self.current_theme)
+        if 'calendar' in self._icon_sizes:
+            view.set_calendar_icon_size(self._icon_sizes['calendar'])
+        self._subscribe_to_theme(view, (('set_calendar_icon_size', 'calendar'),))
+    
+    def _subscribe_to_theme(self, widget: QWidget, icon_sinks: tuple = ()):
+        """Connect a widget to themeApplied.
+        
+        Args:
+            widget: Widget providing apply_theme(theme)
+            icon_sinks: (method_name, size_key) pairs for icon size setters
+        """
+        def on_theme_applied(theme, sizes):
+            widget.apply_theme(theme)
+            for method_name, size_key in icon_sinks:
+                getattr(widget, method_name)(sizes[size_key])
+        
+        self.themeApplied.connect(on_theme_applied)
+    
     def _populate_dummy_data_if_needed(self):
         """Populate database with dummy data if empty."""
+        if self._closing:
+            return
         # Check if database has any entries
-        entries = self.database.get_entries_by_date(self.current_date)
-        
-        if not entries:
-            print("Database empty - populating with dummy data...")
-            populate_database_with_dummy_data(self.database, weeks=8)
-            populate_weather_cache(self.database, days=30)
-            
-            # Refresh current view
+        if not self.database.has_any_entries():
+            log.info("Database empty - populating with dummy data...")
+            # Seed in the background so the dashboard paints immediately;
+            # refresh the current view once the data is in place
+            self._dummy_data_worker = DummyDataWorker(self.database)
+            self._dummy_data_worker.signals.finished.connect(
+                self._on_dummy_data_ready, Qt.QueuedConnection
+            )
+            QThreadPool.globalInstance().start(self._dummy_data_worker)
+    
+    def _on_dummy_data_ready(self):
+        """Show the seeded data, unless the window is already shutting down."""
+        self._dummy_data_worker = None
+        if not self._closing:
             self._refresh_current_view()
     
     def _on_view_changed(self, view_name: str):
@@ -184,25 +374,18 @@ class WeekCalendarApp(QMainWindow):
         Args:
             view_name: Name of view to switch to ("day", "week", "month", "year")
         """
-        view_map = {
-            "day": self.day_view,
-            "week": self.week_view,
-            "month": self.month_view,
-            "year": self.year_view
-        }
-        
-        view = view_map.get(view_name)
-        if view:
-            self.view_stack.setCurrentWidget(view)
-            view.refresh()
+        if self.view_stack.hasLazyWidget(view_name):
+            view = self.view_stack.lazyWidget(view_name)
+            # Re-tapping the active view is a no-op (avoids a DB round trip)
+            if view is not self.view_stack.currentWidget():
+                self.view_stack.setCurrentWidget(view)
+                view.refresh()
     
     def _on_back_clicked(self):
         """Handle back button click - return to dashboard."""
-        current_view = self.view_stack.currentWidget()
-        
         # If on dashboard, exit app
-        if current_view == self.dashboard_view:
-            print("Exiting Week Calendar app...")
+        if self.view_stack.currentIndex() == self._idx_dashboard:
+            log.info("Exiting Week Calendar app...")
             self.close()
         else:
             # Otherwise return to dashboard
@@ -220,8 +403,9 @@ class WeekCalendarApp(QMainWindow):
     
     def _show_settings_fullscreen(self):
         """Show settings view in fullscreen mode."""
-        # Store current theme for potential restore
-        previous_theme = copy.deepcopy(self.current_theme)
+        # Remember current theme name and overrides for potential restore
+        previous_theme_name = self.current_theme.name if self.current_theme else None
+        previous_overrides = dict(self.appearance_settings)
         
         # Create settings view if it doesn't exist
         if not hasattr(self, 'settings_view'):
@@ -229,8 +413,10 @@ class WeekCalendarApp(QMainWindow):
             self.settings_view.settings_changed.connect(self._on_settings_changed)
             self.settings_view.close_requested.connect(self._on_settings_closed)
             self.settings_view.theme_preview_requested.connect(self._handle_theme_preview)
-            self.settings_view.theme_preview_reset.connect(lambda: self._restore_theme_snapshot(previous_theme))
-            self.view_stack.addWidget(self.settings_view)
+            self.settings_view.theme_preview_reset.connect(
+                lambda: self._restore_theme_snapshot(*self._settings_previous_theme)
+            )
+            self._idx_settings = self.view_stack.addWidget(self.settings_view)
         
         # Update theme in case it changed
         self.settings_view.theme = self.current_theme
@@ -240,7 +426,7 @@ class WeekCalendarApp(QMainWindow):
         # Hide navigation bar and show settings
         self.nav_bar.hide()
         self.view_stack.setCurrentWidget(self.settings_view)
-        self._settings_previous_theme = previous_theme
+        self._settings_previous_theme = (previous_theme_name, previous_overrides)
     
     def _on_settings_closed(self):
         """Handle settings view close - return to previous view."""
@@ -248,15 +434,19 @@ class WeekCalendarApp(QMainWindow):
         self.nav_bar.show()
         
         # Return to previous view (dashboard if unsure)
-        if self.view_stack.currentWidget() == self.settings_view:
+        if self.view_stack.currentIndex() == self._idx_settings:
             self.view_stack.setCurrentWidget(self.dashboard_view)
             self.nav_bar.set_active_view(None)
     
     def _on_settings_changed(self):
         """Handle settings changes - refresh weather and views."""
-        print("Settings changed - refreshing data...")
+        log.debug("Settings changed - refreshing data...")
         # Reload screentime settings
         self.screentime_manager.load_settings()
+        # Quick actions dialog caches theme colors and PIN - rebuild on next open
+        if self.quick_actions_dialog and not self.quick_actions_dialog.isVisible():
+            self.quick_actions_dialog.deleteLater()
+            self.quick_actions_dialog = None
         # Reload and apply theme in case it changed
         self._load_and_apply_theme()
         # Reload dashboard launcher config
@@ -272,28 +462,45 @@ class WeekCalendarApp(QMainWindow):
         self._refresh_current_view()
     
     def _handle_theme_preview(self, theme_name: str, overrides: dict):
-        """Apply a live preview theme without persisting it."""
-        theme = self.theme_manager.get_theme(theme_name)
+        """Schedule a live preview theme without persisting it."""
+        self._pending_preview = (theme_name, overrides)
+        self._preview_timer.start()
+    
+    def _apply_pending_preview(self):
+        """Apply the most recent preview request once the burst has settled."""
+        if not self._pending_preview:
+            return
+        theme_name, overrides = self._pending_preview
+        self._pending_preview = None
+        theme = self._get_theme(theme_name)
         if not theme:
             return
         self._apply_theme(theme, overrides)
     
-    def _restore_theme_snapshot(self, snapshot: Optional[Theme]):
+    def _cancel_pending_preview(self):
+        """Drop a scheduled preview so it cannot override a restore/reload."""
+        self._preview_timer.stop()
+        self._pending_preview = None
+    
+    def _restore_theme_snapshot(self, theme_name: Optional[str], overrides: Optional[dict]):
         """Restore the last persisted theme when cancelling previews."""
-        if snapshot:
-            self._apply_theme(snapshot, self.appearance_settings)
+        self._cancel_pending_preview()
+        theme = self._get_theme(theme_name) if theme_name else None
+        if theme:
+            self._apply_theme(theme, overrides)
         else:
             self._load_and_apply_theme()
     
     def _show_week_view(self):
         """Show week view from dashboard."""
-        self.view_stack.setCurrentWidget(self.week_view)
+        week_view = self.view_stack.lazyWidget("week")
+        self.view_stack.setCurrentWidget(week_view)
         self.nav_bar.set_active_view("week")
-        self.week_view.refresh()    
+        week_view.refresh()    
     def _load_and_apply_theme(self):
         """Load theme from settings and apply it to the application."""
+        self._cancel_pending_preview()
         # Load theme name from settings.json
-        import json
         settings_path = Path(__file__).parent / "config" / "settings.json"
         default_theme = "princess"
         theme_name = default_theme
@@ -301,37 +508,60 @@ class WeekCalendarApp(QMainWindow):
         
         try:
             if settings_path.exists():
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    appearance = settings.get("appearance", {}) or {}
-                    self.appearance_settings = appearance
-                    theme_name = appearance.get("theme", default_theme)
+                settings = settings_cache.get_settings(settings_path)
+                if settings is not self._settings_snapshot:
+                    # Settings changed on disk - themes may have been edited as well
+                    self._settings_snapshot = settings
+                    self._theme_cache.clear()
+                    self._merged_theme_cache.clear()
+                appearance = settings.get("appearance", {}) or {}
+                self.appearance_settings = dict(appearance)
+                theme_name = appearance.get("theme", default_theme)
         except Exception as e:
-            print(f"Error loading theme setting: {e}")
+            log.error("Error loading theme setting: %s", e)
             self.appearance_settings = {}
         
         if not theme_name:
             theme_name = default_theme
         
         # Get theme from theme manager
-        theme = self.theme_manager.get_theme(theme_name)
+        theme = self._get_theme(theme_name)
         
         # Fallback to princess preset first, then dark theme
         if theme is None and theme_name != default_theme:
-            print(f"Theme '{theme_name}' not found, switching to '{default_theme}'")
-            theme = self.theme_manager.get_theme(default_theme)
+            log.warning("Theme '%s' not found, switching to '%s'", theme_name, default_theme)
+            theme = self._get_theme(default_theme)
 
         if theme is None:
-            print("Princess theme missing, falling back to 'dark'")
-            theme = self.theme_manager.get_theme("dark")
+            log.warning("Princess theme missing, falling back to 'dark'")
+            theme = self._get_theme("dark")
         
         # If still None, create a default dark theme
         if theme is None:
-            from themes.theme_manager import Theme
             theme = Theme(name=default_theme, display_name="Princess")
         
         self._apply_theme(theme, self.appearance_settings)
     
+    def _prefetch_location_if_auto(self):
+        """Start the IP location lookup early when weather uses auto location."""
+        settings_path = Path(__file__).parent / "config" / "settings.json"
+        try:
+            weather = settings_cache.get_settings(settings_path).get("weather", {}) if settings_path.exists() else {}
+        except Exception as e:
+            log.error("Error reading weather settings: %s", e)
+            return
+        if weather.get("location_mode", "auto") == "auto":
+            prefetch_location()
+    
+    def _get_theme(self, name: str) -> Optional[Theme]:
+        """Resolve a theme by name, memoizing the lookup."""
+        if name in self._theme_cache:
+            return self._theme_cache[name]
+        theme = self.theme_manager.get_theme(name)
+        if theme is not None:
+            self._theme_cache[name] = theme
+        return theme
+    
     def _apply_theme(self, theme: Theme, overrides: Optional[dict] = None):
         """Apply theme to the application with optional appearance overrides."""
         if theme is None:
@@ -340,61 +570,90 @@ class WeekCalendarApp(QMainWindow):
         if overrides:
             override_payload.update(overrides)
         applied_theme = self._merge_theme_overrides(theme, override_payload)
-        self._scale_theme_fonts(applied_theme)
         self.current_theme = applied_theme
         
+        # Re-polishing every widget is expensive; skip if nothing changed
         stylesheet = applied_theme.generate_stylesheet()
-        self.setStyleSheet(stylesheet)
+        sheet_hash = hash(stylesheet)
+        if sheet_hash != self._last_sheet_hash:
+            self.setStyleSheet(stylesheet)
+            self._last_sheet_hash = sheet_hash
         
-        font = QFont(applied_theme.font.family, applied_theme.font.size_normal)
-        QApplication.instance().setFont(font)
+        font_key = (applied_theme.font.family, applied_theme.font.size_normal)
+        if font_key != self._current_app_font:
+            QApplication.instance().setFont(QFont(*font_key))
+            self._current_app_font = font_key
         
-        self._apply_theme_to_components(applied_theme)
         icon_overrides = {}
         if getattr(self, 'icon_scale_overrides', None):
             icon_overrides.update(self.icon_scale_overrides)
         icon_overrides.update(override_payload)
-        self._apply_icon_size(icon_overrides)
-        print(f"Applied theme: {applied_theme.display_name}")
+        self._resolve_icon_sizes(icon_overrides)
+        self._apply_theme_to_components(applied_theme)
+        log.debug("Applied theme: %s", applied_theme.display_name)
 
     def _merge_theme_overrides(self, theme: Theme, overrides: Optional[dict]) -> Theme:
-        """Combine base theme values with appearance overrides from settings."""
-        merged_theme = copy.deepcopy(theme)
+        """Combine base theme values with appearance overrides from settings.
+        
+        The merged (and display-scaled) theme is cached per base theme, base
+        font values and override set, so repeated applies of the same values
+        skip the merge. Colors and decoration are shared with the base theme
+        (see Theme.clone()), so in-place edits to those show up directly; an
+        in-place font edit changes the key and rebuilds the merged copy.
+        """
+        cache_key = (id(theme), astuple(theme.font), self._overrides_key(overrides))
+        cached = self._merged_theme_cache.get(cache_key)
+        # Base theme is kept in the entry so its id cannot be recycled
+        if cached and cached[0] is theme:
+            return cached[1]
+        merged_theme = self._build_merged_theme(theme, overrides)
+        self._scale_theme_fonts(merged_theme)
+        if len(self._merged_theme_cache) >= 32:
+            self._merged_theme_cache.clear()
+        self._merged_theme_cache[cache_key] = (theme, merged_theme)
+        return merged_theme
+    
+    @staticmethod
+    def _overrides_key(overrides: Optional[dict]) -> tuple:
+        """Build a hashable cache key from an overrides dict."""
+        if not overrides:
+            return ()
+        items = []
+        for key, value in sorted(overrides.items()):
+            try:
+                hash(value)
+            except TypeError:
+                value = repr(value)
+            items.append((key, value))
+        return tuple(items)
+    
+    def _build_merged_theme(self, theme: Theme, overrides: Optional[dict]) -> Theme:
+        """Create a copy of theme with appearance overrides applied."""
+        merged_theme = theme.clone()
         if not overrides:
             return merged_theme
+        font = merged_theme.font
         if overrides.get("font_family"):
-            merged_theme.font.family = overrides["font_family"]
-        if "font_size" in overrides and overrides["font_size"]:
+            font.family = overrides["font_family"]
+        
+        font_size = None
+        if overrides.get("font_size"):
             try:
-                requested_size = int(overrides["font_size"])
+                font_size = int(overrides["font_size"])
             except (TypeError, ValueError):
-                requested_size = merged_theme.font.size_normal
-            delta = requested_size - merged_theme.font.size_normal
-            merged_theme.font.size_normal = requested_size
-            merged_theme.font.size_small = max(6, merged_theme.font.size_small + delta)
-            merged_theme.font.size_large = max(8, merged_theme.font.size_large + delta)
-            merged_theme.font.size_xlarge = max(10, merged_theme.font.size_xlarge + delta)
-            merged_theme.font.size_heading = max(12, merged_theme.font.size_heading + delta)
-            merged_theme.font.size_title = max(14, merged_theme.font.size_title + delta)
-        
-        # Apply font scaling percentages
-        font_scale_small = overrides.get("font_scale_small", 0)
-        font_scale_large = overrides.get("font_scale_large", 50)
+                font_size = font.size_normal
         
+        # Font scaling percentages; skip scaling entirely if either is invalid
         try:
-            scale_small = float(font_scale_small) / 100.0
-            scale_large = float(font_scale_large) / 100.0
-            
-            # Apply to smaller fonts (menus, labels, etc.)
-            merged_theme.font.size_small = max(6, int(merged_theme.font.size_small * (1 + scale_small)))
-            
-            # Apply to larger fonts (tiles, icons, headers)
-            merged_theme.font.size_large = max(8, int(merged_theme.font.size_large * (1 + scale_large)))
-            merged_theme.font.size_xlarge = max(10, int(merged_theme.font.size_xlarge * (1 + scale_large)))
-            merged_theme.font.size_heading = max(12, int(merged_theme.font.size_heading * (1 + scale_large)))
-            merged_theme.font.size_title = max(14, int(merged_theme.font.size_title * (1 + scale_large)))
-        except (TypeError, ValueError, ZeroDivisionError):
-            pass  # Keep defaults if scaling fails
+            scale_small = float(overrides.get("font_scale_small", 0)) / 100.0
+            scale_large = float(overrides.get("font_scale_large", 50)) / 100.0
+        except (TypeError, ValueError):
+            scale_small = scale_large = None
+        
+        base_sizes = tuple(getattr(font, field) for field in _FONT_SIZE_FIELDS)
+        sizes = _compute_font_sizes(base_sizes, font_size, scale_small, scale_large)
+        for field, value in zip(_FONT_SIZE_FIELDS, sizes):
+            setattr(font, field, value)
         
         return merged_theme
     
@@ -405,113 +664,122 @@ class WeekCalendarApp(QMainWindow):
         scale = self.scale_factor
         if abs(scale - 1.0) < 0.01:
             return
-        font_fields = [
-            "size_small",
-            "size_normal",
-            "size_large",
-            "size_xlarge",
-            "size_heading",
-            "size_title"
-        ]
-        for field in font_fields:
+        for field in _FONT_SIZE_FIELDS:
             value = getattr(theme.font, field, None)
             if value:
                 setattr(theme.font, field, max(6, int(value * scale)))
     
     def _apply_theme_to_components(self, theme):
-        """Propagate theme updates to child widgets."""
-        targets = [
-            getattr(self, 'nav_bar', None),
-            getattr(self, 'dashboard_view', None),
-            getattr(self, 'day_view', None),
-            getattr(self, 'week_view', None),
-            getattr(self, 'month_view', None),
-            getattr(self, 'year_view', None)
-        ]
-        for widget in targets:
-            if widget and hasattr(widget, 'apply_theme'):
-                widget.apply_theme(theme)
+        """Propagate theme and icon sizes to child widgets via themeApplied."""
         if hasattr(self, 'screentime_manager') and self.screentime_manager:
             self.screentime_manager.set_theme(theme)
+        self._pending_theme_payload = (theme, dict(self._icon_sizes))
+        if not self._theme_flush_armed and not self._theme_emit_timer.isActive():
+            # Leading edge: flush on the next event loop iteration so all
+            # applies issued in this burst are handled together
+            self._theme_flush_armed = True
+            QTimer.singleShot(0, self._flush_theme_applies)
+    
+    def _on_theme_emit_timeout(self):
+        """Trailing edge: flush the latest payload collected during the window."""
+        if self._pending_theme_payload is not None:
+            self._flush_theme_applies()
+    
+    def _flush_theme_applies(self):
+        """Emit themeApplied with the pending payload and open the throttle window."""
+        self._theme_flush_armed = False
+        if self._pending_theme_payload is None:
+            return
+        theme, sizes = self._pending_theme_payload
+        self._pending_theme_payload = None
+        # Suspend repaints so the window updates once for all widgets
+        self.setUpdatesEnabled(False)
+        try:
+            self.themeApplied.emit(theme, sizes)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._theme_emit_timer.start()
 
-    def _apply_icon_size(self, overrides: Optional[dict]):
-        """Propagate the configured icon sizes to widgets that support it."""
-        # Get the three separate icon sizes
-        tile_size = self._resolve_icon_size(overrides, 'tile_icon_size', 64, 32, 120)
-        hero_size = self._resolve_icon_size(overrides, 'hero_icon_size', 96, 64, 160)
-        calendar_size = self._resolve_icon_size(overrides, 'calendar_icon_size', 48, 24, 96)
-        
-        # Apply to dashboard (has both tiles and hero icons)
-        dashboard = getattr(self, 'dashboard_view', None)
-        if dashboard:
-            if hasattr(dashboard, 'set_tile_icon_size'):
-                dashboard.set_tile_icon_size(tile_size)
-            if hasattr(dashboard, 'set_hero_icon_size'):
-                dashboard.set_hero_icon_size(hero_size)
-        
-        # Apply calendar icon size to all calendar views
-        calendar_views = [
-            getattr(self, 'day_view', None),
-            getattr(self, 'week_view', None),
-            getattr(self, 'month_view', None),
-            getattr(self, 'year_view', None)
-        ]
-        for view in calendar_views:
-            if view and hasattr(view, 'set_calendar_icon_size'):
-                view.set_calendar_icon_size(calendar_size)
+    def _resolve_icon_sizes(self, overrides: Optional[dict]):
+        """Resolve the configured tile/hero/calendar icon sizes."""
+        self._icon_sizes = {
+            'tile': self._resolve_icon_size(overrides, 'tile_icon_size', 64, 32, 120),
+            'hero': self._resolve_icon_size(overrides, 'hero_icon_size', 96, 64, 160),
+            'calendar': self._resolve_icon_size(overrides, 'calendar_icon_size', 48, 24, 96)
+        }
 
     def _resolve_icon_size(self, overrides: Optional[dict], key: str, default: int, min_val: int, max_val: int) -> int:
         """Resolve icon size from overrides/settings with sane fallbacks."""
-        candidates = []
-        if overrides:
-            candidates.append(overrides.get(key))
-        if self.appearance_settings:
-            candidates.append(self.appearance_settings.get(key))
-        for value in candidates:
+        for source in (overrides, self.appearance_settings):
+            if not source:
+                continue
+            value = source.get(key)
+            if value is None:
+                continue
             try:
-                sanitized = int(value)
+                value = int(value)
             except (TypeError, ValueError):
                 continue
-            if sanitized > 0:
-                return max(min_val, min(max_val, sanitized))
+            if value > 0:
+                return min_val if value < min_val else max_val if value > max_val else value
         return default
     
     def _rotate_display(self):
         """Rotate display 90 degrees clockwise."""
-        # Get current rotation from database settings
-        current_rotation = int(self.database.get_setting('rotation', '0'))
-        
         # Cycle through rotations: 0 -> 90 -> 180 -> 270 -> 0
-        new_rotation = (current_rotation + 90) % 360
+        self._rotation = (self._rotation + 90) % 360
         
-        # Save new rotation
-        self.database.set_setting('rotation', str(new_rotation))
+        # Save new rotation (debounced)
+        self._rotation_save_timer.start()
         
         # Apply rotation
-        self._apply_rotation(new_rotation)
+        self._apply_rotation(self._rotation)
+    
+    def _save_rotation(self):
+        """Persist the current rotation to the database."""
+        self._rotation_save_timer.stop()
+        self.database.set_setting('rotation', str(self._rotation))
+    
+    def _schedule_day_rollover(self):
+        """Arm a single-shot timer that refreshes self._today just after midnight."""
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        # One second of slack so date.today() has definitely moved on
+        msec = int((next_midnight - now).total_seconds() * 1000) + 1000
+        QTimer.singleShot(msec, self._roll_today)
+    
+    def _roll_today(self):
+        """Update the cached date and re-arm the rollover timer."""
+        self._today = date.today()
+        self._schedule_day_rollover()
+    
+    def closeEvent(self, event):
+        """Flush pending writes before the window closes."""
+        # Late completion signals must not touch the database after close()
+        self._closing = True
+        if self._dummy_data_worker is not None:
+            # Let a running seed finish its transaction before closing the DB
+            QThreadPool.globalInstance().waitForDone()
+            self._dummy_data_worker = None
+        if self._rotation_save_timer.isActive():
+            self._save_rotation()
+        self.screentime_manager.controller.flush_screentime_data()
+        self._db_optimize_timer.stop()
+        shutdown_location_lookups()
+        self.database.close()
+        super().closeEvent(event)
     
     def _apply_rotation(self, rotation: int):
         """Apply rotation transform to main window."""
-        from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
-        from PyQt5.QtGui import QTransform
-        
         # Get central widget
         central = self.centralWidget()
         if not central:
             return
         
-        # Create transform
+        # Create transform (rotation is a multiple of 90° clockwise)
         transform = QTransform()
-        
-        if rotation == 90:
-            # Rotate 90° clockwise
-            transform.rotate(90)
-        elif rotation == 180:
-            # Rotate 180°
-            transform.rotate(180)
-        elif rotation == 270:
-            # Rotate 270° clockwise
-            transform.rotate(270)
+        if rotation:
+            transform.rotate(rotation)
         
         # Apply transform to central widget's graphics effect
         # Note: This is a simple rotation. For production on Pi, 
@@ -519,7 +787,7 @@ class WeekCalendarApp(QMainWindow):
         if hasattr(central, 'setTransform'):
             central.setTransform(transform)
         else:
-            print(f"Display rotation set to {rotation}° (would apply on actual Pi hardware)")    
+            log.info("Display rotation set to %d° (would apply on actual Pi hardware)", rotation)    
     def _show_day_view(self, target_date: date):
         """Show day view for a specific date.
         
@@ -527,8 +795,9 @@ class WeekCalendarApp(QMainWindow):
             target_date: Date to display
         """
         self.current_date = target_date
-        self.day_view.set_date(target_date)
-        self.view_stack.setCurrentWidget(self.day_view)
+        day_view = self.view_stack.lazyWidget("day")
+        day_view.set_date(target_date)
+        self.view_stack.setCurrentWidget(day_view)
         self.nav_bar.set_active_view("day")
     
     def _show_month_view(self, year: int, month: int):
@@ -539,15 +808,15 @@ class WeekCalendarApp(QMainWindow):
             month: Month to display (1-12)
         """
         target_date = date(year, month, 1)
-        self.month_view.set_date(target_date)
-        self.view_stack.setCurrentWidget(self.month_view)
+        month_view = self.view_stack.lazyWidget("month")
+        month_view.set_date(target_date)
+        self.view_stack.setCurrentWidget(month_view)
         self.nav_bar.set_active_view("month")
     
     def _refresh_current_view(self):
         """Refresh the currently visible view."""
-        current_view = self.view_stack.currentWidget()
-        if hasattr(current_view, 'refresh'):
-            current_view.refresh()
+        # Every page in the stack implements refresh()
+        self.view_stack.currentWidget().refresh()
     
     def _on_screentime_update(self, remaining_seconds: int, total_seconds: int):
         """Handle screentime timer updates.
@@ -560,16 +829,28 @@ class WeekCalendarApp(QMainWindow):
         if not self.screentime_manager.enabled:
             return
         
-        # Update navigation bar display
-        self.nav_bar.update_screentime_display(remaining_seconds)
+        now = time.monotonic()
         
-        # Update quick actions dialog if open
+        # Update quick actions dialog if open (throttled to 500ms)
         if self.quick_actions_dialog and self.quick_actions_dialog.isVisible():
-            self.quick_actions_dialog.update_time(remaining_seconds, total_seconds)
+            if now - self._last_dialog_update_ts >= 0.5:
+                self._last_dialog_update_ts = now
+                self.quick_actions_dialog.update_time(remaining_seconds, total_seconds)
+        
+        # Skip navbar repaint if the displayed value hasn't changed within the last second
+        displayed = int(remaining_seconds)
+        if displayed == self._last_displayed_remaining and now - self._last_display_ts < 1.0:
+            return
+        self._last_displayed_remaining = displayed
+        self._last_display_ts = now
+        
+        # Update navigation bar display
+        self.nav_bar.update_screentime_display(displayed)
     
     def _on_screentime_stopped(self):
         """Handle screentime timer stopped."""
         self.nav_bar.reset_settings_display()
+        self._last_displayed_remaining = None
         
         if self.quick_actions_dialog:
             self.quick_actions_dialog.close()
@@ -584,27 +865,33 @@ class WeekCalendarApp(QMainWindow):
             remaining_seconds = self.screentime_manager.get_remaining_time()
             total_seconds = self.screentime_manager.limit_minutes * 60
             
-            self.quick_actions_dialog = ScreenTimeQuickActionsDialog(
-                remaining_seconds,
-                total_seconds,
-                self,
-                theme=self.current_theme
-            )
-            
-            # Connect signals
-            self.quick_actions_dialog.time_added.connect(self._on_time_added)
-            self.quick_actions_dialog.timer_cancelled.connect(self._on_timer_cancelled)
-            self.quick_actions_dialog.credit_tomorrow.connect(self._on_credit_tomorrow)
+            # Reuse the dialog between openings; it is rebuilt only after the
+            # timer stops or settings (theme, PIN) change
+            dialog = self.quick_actions_dialog
+            if dialog is None or dialog.parent() is not self:
+                dialog = ScreenTimeQuickActionsDialog(
+                    remaining_seconds,
+                    total_seconds,
+                    self,
+                    theme=self.current_theme
+                )
+                
+                # Connect signals
+                dialog.time_added.connect(self._on_time_added)
+                dialog.timer_cancelled.connect(self._on_timer_cancelled)
+                dialog.credit_tomorrow.connect(self._on_credit_tomorrow)
+                self.quick_actions_dialog = dialog
+            else:
+                dialog.setGeometry(self.geometry())
+                dialog.update_time(remaining_seconds, total_seconds)
             
-            self.quick_actions_dialog.exec_()
+            dialog.exec_()
             
             # Resume timer after dialog closes
             if self.screentime_manager.is_running():
                 self.screentime_manager.resume()
         except Exception as e:
-            print(f"Error showing screentime quick actions: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error showing screentime quick actions: %s", e)
     
     def _on_time_added(self, minutes: int):
         """Handle time added to current session.
@@ -616,9 +903,7 @@ class WeekCalendarApp(QMainWindow):
         
         # Also update today's used time to reflect the added time
         # (so it doesn't count against the daily limit)
-        from datetime import date
-        today = date.today()
-        self.screentime_manager.controller.add_used_time(-minutes, today)
+        self.screentime_manager.controller.add_used_time(-minutes, self._today)
     
     def _on_timer_cancelled(self):
         """Handle timer cancellation."""
@@ -630,8 +915,7 @@ class WeekCalendarApp(QMainWindow):
         Args:
             minutes: Minutes to credit
         """
-        from datetime import date, timedelta
-        tomorrow = date.today() + timedelta(days=1)
+        tomorrow = self._today + timedelta(days=1)
         self.screentime_manager.controller.credit_time_for_day(minutes, tomorrow)
 
 
@@ -658,6 +942,12 @@ def _determine_scale_factor(app: QApplication, windowed: bool) -> float:
 def main():
     """Main entry point."""
     windowed = "--windowed" in sys.argv
+    
+    # Quiet by default; WEEK_CALENDAR_LOG_LEVEL=DEBUG/INFO for diagnostics
+    logging.basicConfig(
+        level=os.environ.get("WEEK_CALENDAR_LOG_LEVEL", "WARNING").upper(),
+        format="%(levelname)s %(name)s: %(message)s"
+    )
 
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
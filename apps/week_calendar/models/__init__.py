@@ -10,7 +10,8 @@ from .calendar_entry import (
     SPECIAL_CATEGORIES,
     get_default_icon,
     get_default_color,
-    is_special_category
+    is_special_category,
+    expand_occurrences
 )
 from .database import CalendarDatabase
 
@@ -23,5 +24,6 @@ __all__ = [
     'SPECIAL_CATEGORIES',
     'get_default_icon',
     'get_default_color',
-    'is_special_category'
+    'is_special_category',
+    'expand_occurrences'
 ]
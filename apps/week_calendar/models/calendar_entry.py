@@ -5,19 +5,24 @@ Represents a single calendar event with validation and utility methods.
 """
 
 from dataclasses import dataclass, field
-from datetime import date, time
-from typing import Optional
+from datetime import date, time, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+import sys
 import uuid
 
 
-@dataclass
+# Slotted instances (no per-entry __dict__) where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CalendarEntry:
     """Represents a calendar event/entry."""
     
     title: str
     entry_date: date
     category: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     start_time: Optional[time] = None
     end_time: Optional[time] = None
     icon: Optional[str] = None
@@ -26,16 +31,18 @@ class CalendarEntry:
     color: Optional[str] = None
     recurring: Optional[str] = None  # "daily", "weekly", "monthly", or None
     recurring_end_date: Optional[date] = None
+    # Memoized get_time_display() result (times don't change after construction)
+    _cached_time_display: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate entry data after initialization."""
         if not self.title:
             raise ValueError("Title cannot be empty")
         
-        if self.category not in VALID_CATEGORIES:
+        if self.category not in _VALID_CATEGORIES_SET:
             raise ValueError(f"Invalid category: {self.category}")
         
-        if self.recurring and self.recurring not in VALID_RECURRING_PATTERNS:
+        if self.recurring and self.recurring not in _VALID_RECURRING_SET:
             raise ValueError(f"Invalid recurring pattern: {self.recurring}")
         
         if self.start_time and self.end_time:
@@ -63,6 +70,29 @@ class CalendarEntry:
             'recurring_end_date': self.recurring_end_date.isoformat() if self.recurring_end_date else None
         }
     
+    def as_row_tuple(self) -> tuple:
+        """Convert entry to a database row without an intermediate dict.
+        
+        Returns:
+            Column values in calendar_entries insert order (id, title, date,
+            start_time, end_time, category, icon, description, is_special,
+            color, recurring, recurring_end_date)
+        """
+        return (
+            self.id,
+            self.title,
+            self.entry_date.isoformat(),
+            self.start_time.isoformat() if self.start_time else None,
+            self.end_time.isoformat() if self.end_time else None,
+            self.category,
+            self.icon,
+            self.description,
+            1 if self.is_special else 0,
+            self.color,
+            self.recurring,
+            self.recurring_end_date.isoformat() if self.recurring_end_date else None
+        )
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'CalendarEntry':
         """Create entry from dictionary (e.g., from database).
@@ -82,7 +112,7 @@ class CalendarEntry:
         return cls(
             id=data['id'],
             title=data['title'],
-            date=entry_date,
+            entry_date=entry_date,
             start_time=start_time,
             end_time=end_time,
             category=data['category'],
@@ -100,16 +130,20 @@ class CalendarEntry:
         Returns:
             Formatted time string (e.g., "3:00 PM" or "3:00 PM - 4:30 PM")
         """
-        if not self.start_time:
-            return "All day"
-        
-        start_str = self.start_time.strftime("%I:%M %p").lstrip('0')
+        display = self._cached_time_display
+        if display is not None:
+            return display
         
-        if self.end_time:
-            end_str = self.end_time.strftime("%I:%M %p").lstrip('0')
-            return f"{start_str} - {end_str}"
+        if not self.start_time:
+            display = "All day"
+        else:
+            display = self.start_time.strftime("%I:%M %p").lstrip('0')
+            if self.end_time:
+                end_str = self.end_time.strftime("%I:%M %p").lstrip('0')
+                display = f"{display} - {end_str}"
         
-        return start_str
+        self._cached_time_display = display
+        return display
     
     def is_all_day(self) -> bool:
         """Check if this is an all-day event.
@@ -140,6 +174,10 @@ VALID_RECURRING_PATTERNS = [
     "monthly"
 ]
 
+# Hashed views of the lists above for validation (lists keep UI ordering)
+_VALID_CATEGORIES_SET = frozenset(VALID_CATEGORIES)
+_VALID_RECURRING_SET = frozenset(VALID_RECURRING_PATTERNS)
+
 # Default icons for each category
 CATEGORY_ICONS = {
     "School": "school.png",
@@ -169,6 +207,11 @@ CATEGORY_COLORS = {
 # Special event categories (shown in year view)
 SPECIAL_CATEGORIES = ["Birthday", "Holiday", "Vacation"]
 
+# Pre-bound lookups for the per-entry helpers below (hit on every view render)
+_ICON_GET = CATEGORY_ICONS.get
+_COLOR_GET = CATEGORY_COLORS.get
+_SPECIAL = frozenset(SPECIAL_CATEGORIES)
+
 
 def get_default_icon(category: str) -> str:
     """Get default icon filename for a category.
@@ -179,7 +222,7 @@ def get_default_icon(category: str) -> str:
     Returns:
         Icon filename
     """
-    return CATEGORY_ICONS.get(category, "other.png")
+    return _ICON_GET(category, "other.png")
 
 
 def get_default_color(category: str) -> str:
@@ -191,7 +234,7 @@ def get_default_color(category: str) -> str:
     Returns:
         Color hex code
     """
-    return CATEGORY_COLORS.get(category, "#34495E")
+    return _COLOR_GET(category, "#34495E")
 
 
 def is_special_category(category: str) -> bool:
@@ -203,4 +246,48 @@ def is_special_category(category: str) -> bool:
     Returns:
         True if this is a special event category
     """
-    return category in SPECIAL_CATEGORIES
+    return category in _SPECIAL
+
+
+@lru_cache(maxsize=1024)
+def expand_occurrences(first_date: date, recurring: str, end_date: Optional[date],
+                       range_start: date, range_end: date) -> Tuple[date, ...]:
+    """Get the dates a recurring entry falls on within a date range.
+    
+    Views re-query the same ranges on every refresh, so results are cached.
+    
+    Args:
+        first_date: Date of the first occurrence (the entry's own date)
+        recurring: Recurring pattern ("daily", "weekly" or "monthly")
+        end_date: Last date the entry may recur on, or None for no end
+        range_start: Start of range (inclusive)
+        range_end: End of range (inclusive)
+        
+    Returns:
+        Occurrence dates in ascending order
+    """
+    last = range_end if end_date is None or end_date > range_end else end_date
+    start = max(first_date, range_start)
+    if start > last:
+        return ()
+    
+    if recurring == "monthly":
+        # Same day of month; months without that day are skipped
+        occurrences = []
+        year, month = start.year, start.month
+        while (year, month) <= (last.year, last.month):
+            try:
+                day = date(year, month, first_date.day)
+            except ValueError:
+                day = None
+            if day is not None and start <= day <= last:
+                occurrences.append(day)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return tuple(occurrences)
+    
+    step = 7 if recurring == "weekly" else 1
+    offset = (start - first_date).days % step
+    if offset:
+        start += timedelta(days=step - offset)
+    count = (last - start).days // step + 1 if start <= last else 0
+    return tuple(start + timedelta(days=step * i) for i in range(count))
@@ -6,11 +6,257 @@ Optimized for Pi2 performance with proper indexing.
 """
 
 import sqlite3
+import threading
+import time
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from datetime import date, datetime
+from typing import Iterable, List, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
 from contextlib import contextmanager
 
+from .calendar_entry import expand_occurrences
+
+
+# Per-connection tuning (journal_mode=WAL is persistent and set once in
+# _init_database). NORMAL sync is safe under WAL and avoids an fsync per
+# commit on the SD card; the rest keeps hot pages and temp data in RAM.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=67108864",
+    "PRAGMA busy_timeout=5000",
+)
+
+# How long a get_weather() result is served from memory
+_WEATHER_CACHE_TTL = 300.0
+
+# Rows bound per executemany() call in the bulk writers, so very large
+# imports don't materialize every parameter tuple at once
+_BULK_BATCH_SIZE = 500
+
+# Full schema, applied in one executescript() batch at startup
+_SCHEMA_SQL = """
+BEGIN;
+
+-- Calendar entries table
+CREATE TABLE IF NOT EXISTS calendar_entries (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    category TEXT NOT NULL,
+    icon TEXT,
+    description TEXT,
+    is_special INTEGER DEFAULT 0,
+    color TEXT,
+    recurring TEXT,
+    recurring_end_date TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- (date, start_time) serves both the per-day lookup (already in
+-- ORDER BY start_time order, no sort step) and date-range scans,
+-- so plain idx_date is retired
+DROP INDEX IF EXISTS idx_date;
+CREATE INDEX IF NOT EXISTS idx_date_starttime
+    ON calendar_entries(date, start_time);
+
+CREATE INDEX IF NOT EXISTS idx_category
+    ON calendar_entries(category);
+
+-- Special events are a small subset: index only those rows, by date,
+-- instead of a low-selectivity index over is_special
+DROP INDEX IF EXISTS idx_special;
+CREATE INDEX IF NOT EXISTS idx_special_date
+    ON calendar_entries(date) WHERE is_special = 1;
+
+CREATE INDEX IF NOT EXISTS idx_date_category
+    ON calendar_entries(date, category);
+
+-- Recurring entries are stored once and expanded on read; the
+-- per-query scan for them only touches this small subset
+CREATE INDEX IF NOT EXISTS idx_recurring_date
+    ON calendar_entries(date) WHERE recurring IS NOT NULL;
+
+-- Weather data table (cached forecasts)
+CREATE TABLE IF NOT EXISTS weather_cache (
+    date TEXT PRIMARY KEY,
+    icon TEXT NOT NULL,
+    temperature_high INTEGER,
+    temperature_low INTEGER,
+    description TEXT,
+    fetched_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- App settings table
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMIT;
+"""
+
+# Hot query texts as module constants so sqlite3's statement cache keys on a
+# stable string (and keeps the prepared statement) across calls
+_SQL_ADD_ENTRY = """
+    INSERT INTO calendar_entries 
+    (id, title, date, start_time, end_time, category, icon, 
+     description, is_special, color, recurring, recurring_end_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns the calendar views read; bookkeeping/recurrence columns are skipped
+_ENTRY_VIEW_COLUMNS = (
+    "id, title, date, start_time, end_time, category, icon, "
+    "description, is_special, color"
+)
+
+# Single (non-recurring) entries; recurring ones come from the
+# _SQL_GET_RECURRING* queries and are expanded in Python
+_SQL_GET_BY_DATE = f"""
+    SELECT {_ENTRY_VIEW_COLUMNS} FROM calendar_entries 
+    WHERE date = ? AND recurring IS NULL
+    ORDER BY start_time
+"""
+
+_SQL_GET_BY_DATE_RANGE = f"""
+    SELECT {_ENTRY_VIEW_COLUMNS} FROM calendar_entries 
+    WHERE date BETWEEN ? AND ? AND recurring IS NULL
+    ORDER BY date, start_time
+"""
+
+_SQL_GET_SPECIAL_BY_MONTH = """
+    SELECT id, title, date, category, icon, color FROM calendar_entries 
+    WHERE date >= ? AND date < ? AND is_special = 1 AND recurring IS NULL
+    ORDER BY date
+"""
+
+# Recurring entries that may occur in [?2, ?1]: started on or before the
+# range end and not ended before the range start
+_SQL_GET_RECURRING = f"""
+    SELECT {_ENTRY_VIEW_COLUMNS}, recurring, recurring_end_date FROM calendar_entries 
+    WHERE recurring IS NOT NULL AND date <= ?
+      AND (recurring_end_date IS NULL OR recurring_end_date >= ?)
+"""
+
+_SQL_GET_RECURRING_SPECIAL = """
+    SELECT id, title, date, category, icon, color, recurring, recurring_end_date
+    FROM calendar_entries 
+    WHERE recurring IS NOT NULL AND date <= ? AND is_special = 1
+      AND (recurring_end_date IS NULL OR recurring_end_date >= ?)
+"""
+
+_SQL_GET_WEATHER = """
+    SELECT * FROM weather_cache 
+    WHERE date = ?
+"""
+
+# UPSERTs (SQLite 3.24+) update existing rows in place instead of the
+# delete + insert that INSERT OR REPLACE performs
+_SQL_UPSERT_WEATHER = """
+    INSERT INTO weather_cache 
+    (date, icon, temperature_high, temperature_low, description, fetched_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(date) DO UPDATE SET
+        icon = excluded.icon,
+        temperature_high = excluded.temperature_high,
+        temperature_low = excluded.temperature_low,
+        description = excluded.description,
+        fetched_at = CURRENT_TIMESTAMP
+"""
+
+# Copy a prebuilt seed database (attached as "seed") with all dates shifted
+# by a SQLite date modifier such as '+35 days'
+_SQL_COPY_SEED_ENTRIES = """
+    INSERT INTO calendar_entries 
+    (id, title, date, start_time, end_time, category, icon, 
+     description, is_special, color, recurring, recurring_end_date)
+    SELECT id, title, date(date, ?1), start_time, end_time, category, icon,
+           description, is_special, color, recurring, date(recurring_end_date, ?1)
+    FROM seed.calendar_entries
+"""
+
+_SQL_COPY_SEED_WEATHER = """
+    INSERT INTO weather_cache 
+    (date, icon, temperature_high, temperature_low, description)
+    SELECT date(date, ?1), icon, temperature_high, temperature_low, description
+    FROM seed.weather_cache
+"""
+
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+
+_SQL_SET_SETTING = """
+    INSERT INTO settings (key, value, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def _entry_row(entry_data: Dict) -> tuple:
+    """Build the _SQL_ADD_ENTRY parameter tuple from an entry dictionary."""
+    return (
+        entry_data['id'],
+        entry_data['title'],
+        entry_data['date'],
+        entry_data.get('start_time'),
+        entry_data.get('end_time'),
+        entry_data['category'],
+        entry_data.get('icon'),
+        entry_data.get('description'),
+        1 if entry_data.get('is_special') else 0,
+        entry_data.get('color'),
+        entry_data.get('recurring'),
+        entry_data.get('recurring_end_date')
+    )
+
+
+def _expand_recurring(rows: Iterable, range_start: date, range_end: date) -> List[Dict]:
+    """Expand recurring entry rows into one dictionary per occurrence.
+    
+    Args:
+        rows: Rows from a _SQL_GET_RECURRING* query
+        range_start: Start of range (inclusive)
+        range_end: End of range (inclusive)
+        
+    Returns:
+        Entry dictionaries shaped like single entries, dated per occurrence
+    """
+    occurrences = []
+    for row in rows:
+        entry = dict(row)
+        recurring = entry.pop('recurring')
+        end_s = entry.pop('recurring_end_date')
+        days = expand_occurrences(
+            date.fromisoformat(entry['date']), recurring,
+            date.fromisoformat(end_s) if end_s else None,
+            range_start, range_end
+        )
+        occurrences.extend({**entry, 'date': day.isoformat()} for day in days)
+    return occurrences
+
+
+def _entry_sort_key(entry: Dict) -> tuple:
+    """Sort key matching ORDER BY date, start_time (all-day entries first)."""
+    return (entry['date'], entry.get('start_time') or '')
+
+
+def _weather_row(weather_data: Dict) -> tuple:
+    """Build the _SQL_UPSERT_WEATHER parameter tuple from a weather dictionary."""
+    return (
+        weather_data['date'],
+        weather_data['icon'],
+        weather_data.get('temperature_high'),
+        weather_data.get('temperature_low'),
+        weather_data.get('description')
+    )
+
 
 class CalendarDatabase:
     """Manages SQLite database for calendar data."""
@@ -28,90 +274,186 @@ class CalendarDatabase:
         
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Long-lived connections keep SQLite's page cache warm between calls.
+        # Writes share one connection, serialized by the lock; reads use a
+        # second one so they never wait for (or block) a background writer
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._tx_owner: Optional[int] = None
+        self._conn = self._connect()
         self._init_database()
+        self._read_lock = threading.Lock()
+        self._read_conn = self._connect()
+        
+        # Read-through caches for the small, hot weather/settings lookups;
+        # writers invalidate the affected keys. Every invalidation bumps the
+        # generation, so a read that raced with one doesn't store its result.
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        self._invalidate_on_commit = False
+        self._weather_cache: Dict[str, Tuple[float, Optional[Dict]]] = {}
+        self._settings_cache: Dict[str, Optional[str]] = {}
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection and apply per-connection pragmas.
+        
+        Returns:
+            Configured SQLite connection
+        """
+        # isolation_level=None: transactions are managed by get_connection()
+        # and read_connection()
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # Write-ahead logging: readers don't block on writes, fewer fsyncs.
+        # Persistent in the file, but must be set outside a transaction.
+        conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager yielding the write connection inside a transaction.
+        
+        Takes SQLite's write lock up front (BEGIN IMMEDIATE); use
+        read_connection() for queries that don't modify anything.
+        Nested use on the same thread joins the outer transaction, which is
+        committed (or rolled back on error) when the outermost block exits.
+        """
+        with self._lock:
+            outermost = self._tx_depth == 0
+            if outermost:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._tx_owner = threading.get_ident()
+            self._tx_depth += 1
+            try:
+                yield self._conn
+            except BaseException:
+                if outermost:
+                    self._conn.rollback()
+                raise
+            else:
+                if outermost:
+                    self._conn.execute("COMMIT")
+            finally:
+                self._tx_depth -= 1
+                if outermost:
+                    self._tx_owner = None
+                    if self._invalidate_on_commit:
+                        # Caches were invalidated before this commit; readers
+                        # may have re-cached pre-commit rows since then
+                        self._invalidate_on_commit = False
+                        self._invalidate_caches(clear_all=True)
+    
+    def _invalidate_caches(self, weather_keys: Iterable[str] = (),
+                           setting_keys: Iterable[str] = (), clear_all: bool = False):
+        """Drop cached weather/settings values after a write.
+        
+        Called after the write's transaction block exits. When that block was
+        nested in an outer transaction, everything is invalidated again once
+        the outer transaction commits.
+        
+        Args:
+            weather_keys: ISO dates whose cached weather is stale
+            setting_keys: Setting keys whose cached values are stale
+            clear_all: Drop both caches entirely
+        """
+        if self._tx_owner == threading.get_ident():
+            self._invalidate_on_commit = True
+        with self._cache_lock:
+            self._cache_generation += 1
+            if clear_all:
+                self._weather_cache.clear()
+                self._settings_cache.clear()
+                return
+            for key in weather_keys:
+                self._weather_cache.pop(key, None)
+            for key in setting_keys:
+                self._settings_cache.pop(key, None)
+    
+    @contextmanager
+    def read_connection(self):
+        """Context manager yielding a connection for read-only queries.
+        
+        Reads run on a separate connection in a deferred transaction, so the
+        queries in one block see a single consistent snapshot without taking
+        the write lock. Under WAL they proceed while a background writer
+        (e.g. dummy data seeding) holds its transaction open, and see the
+        last committed state. A thread that is itself inside get_connection()
+        reads through its own transaction instead, so it sees its
+        uncommitted changes.
+        """
+        if self._tx_owner == threading.get_ident():
+            # Only this thread sets _tx_owner to its own id, and it still
+            # holds self._lock, so the write connection is safe to use
+            yield self._conn
+            return
+        
+        with self._read_lock:
+            self._read_conn.execute("BEGIN")
+            try:
+                yield self._read_conn
+            finally:
+                self._read_conn.execute("COMMIT")
+    
+    @contextmanager
+    def bulk_seed(self, durable: bool = True):
+        """Context manager grouping bulk inserts into one transaction.
+        
+        Bulk writers (add_entry_rows(), cache_weather_bulk(), ...) called
+        inside the block join a single transaction, so the whole seed costs
+        one commit.
+        
+        Usage:
+            with database.bulk_seed():
+                database.add_entry_rows(rows)
+                database.cache_weather_bulk(weather)
+        
+        Args:
+            durable: Keep synchronous=NORMAL. Pass False only for throwaway
+                files (e.g. the dev seed build) to skip fsyncs entirely;
+                never for the app's live database.
+        """
+        with self._lock:
+            # synchronous can only be changed outside a transaction
+            relax_sync = not durable and self._tx_depth == 0
+            if relax_sync:
+                self._conn.execute("PRAGMA synchronous=OFF")
+            try:
+                with self.get_connection():
+                    yield self
+            finally:
+                if relax_sync:
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+    
+    def optimize(self):
+        """Let SQLite refresh planner statistics for tables that changed.
+        
+        Usually a no-op; cheap enough to run periodically and on close.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+    
+    def close(self):
+        """Close the database connections."""
+        with self._read_lock:
+            self._read_conn.close()
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
     
     def _init_database(self):
-        """Create database tables if they don't exist."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Calendar entries table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS calendar_entries (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    start_time TEXT,
-                    end_time TEXT,
-                    category TEXT NOT NULL,
-                    icon TEXT,
-                    description TEXT,
-                    is_special INTEGER DEFAULT 0,
-                    color TEXT,
-                    recurring TEXT,
-                    recurring_end_date TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create indexes for fast queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_date 
-                ON calendar_entries(date)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_category 
-                ON calendar_entries(category)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_special 
-                ON calendar_entries(is_special)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_date_category 
-                ON calendar_entries(date, category)
-            """)
-            
-            # Weather data table (cached forecasts)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS weather_cache (
-                    date TEXT PRIMARY KEY,
-                    icon TEXT NOT NULL,
-                    temperature_high INTEGER,
-                    temperature_low INTEGER,
-                    description TEXT,
-                    fetched_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # App settings table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.commit()
+        """Create database tables and indexes if they don't exist."""
+        # executescript() manages its own transaction (it COMMITs first),
+        # so run it on the raw connection rather than via get_connection()
+        with self._lock:
+            self._conn.executescript(_SCHEMA_SQL)
     
     def add_entry(self, entry_data: Dict) -> str:
         """Add a new calendar entry.
@@ -125,28 +467,53 @@ class CalendarDatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT INTO calendar_entries 
-                (id, title, date, start_time, end_time, category, icon, 
-                 description, is_special, color, recurring, recurring_end_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry_data['id'],
-                entry_data['title'],
-                entry_data['date'],
-                entry_data.get('start_time'),
-                entry_data.get('end_time'),
-                entry_data['category'],
-                entry_data.get('icon'),
-                entry_data.get('description'),
-                1 if entry_data.get('is_special') else 0,
-                entry_data.get('color'),
-                entry_data.get('recurring'),
-                entry_data.get('recurring_end_date')
-            ))
+            cursor.execute(_SQL_ADD_ENTRY, _entry_row(entry_data))
             
             return entry_data['id']
     
+    def add_entries(self, entries: Iterable[Dict]) -> int:
+        """Add many calendar entries in a single transaction.
+        
+        Args:
+            entries: Iterable of dictionaries containing entry fields
+            
+        Returns:
+            Number of entries inserted
+        """
+        return self.add_entry_rows(map(_entry_row, entries))
+    
+    def add_entry_rows(self, rows: Iterable[tuple]) -> int:
+        """Add many pre-built entry rows in a single transaction.
+        
+        Args:
+            rows: Iterable of tuples in _SQL_ADD_ENTRY column order,
+                e.g. from CalendarEntry.as_row_tuple()
+            
+        Returns:
+            Number of entries inserted
+        """
+        rows = iter(rows)
+        count = 0
+        with self.get_connection() as conn:
+            while True:
+                batch = list(islice(rows, _BULK_BATCH_SIZE))
+                if not batch:
+                    break
+                conn.executemany(_SQL_ADD_ENTRY, batch)
+                count += len(batch)
+        return count
+    
+    def has_any_entries(self) -> bool:
+        """Check whether any calendar entries exist.
+        
+        Returns:
+            True if at least one entry is stored
+        """
+        with self.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM calendar_entries LIMIT 1")
+            return cursor.fetchone() is not None
+    
     def get_entries_by_date(self, target_date: date) -> List[Dict]:
         """Get all entries for a specific date.
         
@@ -156,16 +523,20 @@ class CalendarDatabase:
         Returns:
             List of entry dictionaries
         """
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT * FROM calendar_entries 
-                WHERE date = ?
-                ORDER BY start_time
-            """, (target_date.isoformat(),))
+            date_s = target_date.isoformat()
+            cursor.execute(_SQL_GET_BY_DATE, (date_s,))
+            entries = [dict(row) for row in cursor.fetchall()]
+            
+            cursor.execute(_SQL_GET_RECURRING, (date_s, date_s))
+            recurring = _expand_recurring(cursor.fetchall(), target_date, target_date)
+            if recurring:
+                entries.extend(recurring)
+                entries.sort(key=_entry_sort_key)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return entries
     
     def get_entries_by_date_range(self, start_date: date, end_date: date) -> List[Dict]:
         """Get all entries within a date range.
@@ -177,16 +548,20 @@ class CalendarDatabase:
         Returns:
             List of entry dictionaries
         """
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT * FROM calendar_entries 
-                WHERE date BETWEEN ? AND ?
-                ORDER BY date, start_time
-            """, (start_date.isoformat(), end_date.isoformat()))
+            start_s, end_s = start_date.isoformat(), end_date.isoformat()
+            cursor.execute(_SQL_GET_BY_DATE_RANGE, (start_s, end_s))
+            entries = [dict(row) for row in cursor.fetchall()]
             
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL_GET_RECURRING, (end_s, start_s))
+            recurring = _expand_recurring(cursor.fetchall(), start_date, end_date)
+            if recurring:
+                entries.extend(recurring)
+                entries.sort(key=_entry_sort_key)
+            
+            return entries
     
     def get_special_events_by_month(self, year: int, month: int) -> List[Dict]:
         """Get special events (birthdays, holidays) for a specific month.
@@ -198,23 +573,27 @@ class CalendarDatabase:
         Returns:
             List of special event dictionaries
         """
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             
-            # Get first and last day of month
-            start_date = date(year, month, 1)
-            if month == 12:
-                end_date = date(year + 1, 1, 1)
-            else:
-                end_date = date(year, month + 1, 1)
+            # First day of this month and of the next, as ISO strings
+            # (dates are stored as ISO text, so string comparison is exact)
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            start_s = f"{year:04d}-{month:02d}-01"
+            end_s = f"{next_year:04d}-{next_month:02d}-01"
+            
+            cursor.execute(_SQL_GET_SPECIAL_BY_MONTH, (start_s, end_s))
+            entries = [dict(row) for row in cursor.fetchall()]
             
-            cursor.execute("""
-                SELECT * FROM calendar_entries 
-                WHERE date >= ? AND date < ? AND is_special = 1
-                ORDER BY date
-            """, (start_date.isoformat(), end_date.isoformat()))
+            month_start = date(year, month, 1)
+            month_end = date(next_year, next_month, 1) - timedelta(days=1)
+            cursor.execute(_SQL_GET_RECURRING_SPECIAL, (month_end.isoformat(), start_s))
+            recurring = _expand_recurring(cursor.fetchall(), month_start, month_end)
+            if recurring:
+                entries.extend(recurring)
+                entries.sort(key=lambda entry: entry['date'])
             
-            return [dict(row) for row in cursor.fetchall()]
+            return entries
     
     def get_weather(self, target_date: date) -> Optional[Dict]:
         """Get cached weather data for a date.
@@ -225,16 +604,28 @@ class CalendarDatabase:
         Returns:
             Weather dictionary or None if not found
         """
-        with self.get_connection() as conn:
+        key = target_date.isoformat()
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._weather_cache.get(key)
+            generation = self._cache_generation
+        if cached is not None and now - cached[0] < _WEATHER_CACHE_TTL:
+            weather = cached[1]
+            return dict(weather) if weather is not None else None
+        
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT * FROM weather_cache 
-                WHERE date = ?
-            """, (target_date.isoformat(),))
+            cursor.execute(_SQL_GET_WEATHER, (key,))
             
             row = cursor.fetchone()
-            return dict(row) if row else None
+            weather = dict(row) if row else None
+        
+        with self._cache_lock:
+            # Skip storing if a writer invalidated the cache during the query
+            if self._cache_generation == generation:
+                self._weather_cache[key] = (now, weather)
+        return dict(weather) if weather is not None else None
     
     def cache_weather(self, weather_data: Dict):
         """Cache weather data for a date.
@@ -245,17 +636,31 @@ class CalendarDatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO weather_cache 
-                (date, icon, temperature_high, temperature_low, description, fetched_at)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
-                weather_data['date'],
-                weather_data['icon'],
-                weather_data.get('temperature_high'),
-                weather_data.get('temperature_low'),
-                weather_data.get('description')
-            ))
+            cursor.execute(_SQL_UPSERT_WEATHER, _weather_row(weather_data))
+        
+        self._invalidate_caches(weather_keys=(weather_data['date'],))
+    
+    def cache_weather_bulk(self, weather_items: Iterable[Dict]) -> int:
+        """Cache weather data for many dates in a single transaction.
+        
+        Args:
+            weather_items: Iterable of weather dictionaries (see cache_weather)
+            
+        Returns:
+            Number of days cached
+        """
+        rows = map(_weather_row, weather_items)
+        cached_dates = []
+        with self.get_connection() as conn:
+            while True:
+                batch = list(islice(rows, _BULK_BATCH_SIZE))
+                if not batch:
+                    break
+                conn.executemany(_SQL_UPSERT_WEATHER, batch)
+                cached_dates.extend(row[0] for row in batch)
+        
+        self._invalidate_caches(weather_keys=cached_dates)
+        return len(cached_dates)
     
     def get_setting(self, key: str, default: str = None) -> Optional[str]:
         """Get a setting value.
@@ -267,15 +672,23 @@ class CalendarDatabase:
         Returns:
             Setting value or default
         """
-        with self.get_connection() as conn:
+        with self._cache_lock:
+            if key in self._settings_cache:
+                value = self._settings_cache[key]
+                return value if value is not None else default
+            generation = self._cache_generation
+        
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT value FROM settings WHERE key = ?
-            """, (key,))
-            
-            row = cursor.fetchone()
-            return row['value'] if row else default
+            row = cursor.execute(_SQL_GET_SETTING, (key,)).fetchone()
+            value = row['value'] if row else None
+        
+        with self._cache_lock:
+            # Skip storing if a writer invalidated the cache during the query
+            if self._cache_generation == generation:
+                self._settings_cache[key] = value
+        return value if value is not None else default
     
     def set_setting(self, key: str, value: str):
         """Set a setting value.
@@ -287,10 +700,9 @@ class CalendarDatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO settings (key, value, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-            """, (key, value))
+            cursor.execute(_SQL_SET_SETTING, (key, value))
+        
+        self._invalidate_caches(setting_keys=(key,))
     
     def clear_all_entries(self):
         """Clear all calendar entries (for testing/reset)."""
@@ -298,8 +710,52 @@ class CalendarDatabase:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM calendar_entries")
     
+    def load_seed(self, seed_path: Path, day_offset: int = 0) -> int:
+        """Replace all entries and cached weather with a seed database's.
+        
+        The copy runs entirely inside SQLite (ATTACH + INSERT ... SELECT),
+        so no rows pass through Python. Settings are left untouched.
+        Must be called outside any get_connection()/bulk_seed() block,
+        since SQLite does not allow ATTACH inside a transaction; the copy
+        runs in its own transaction.
+        
+        Args:
+            seed_path: SQLite file with calendar_entries and weather_cache tables
+            day_offset: Days to shift every stored date by
+            
+        Returns:
+            Number of entries copied
+            
+        Raises:
+            RuntimeError: If called while a transaction is open
+        """
+        modifier = f"{day_offset:+d} days"
+        with self._lock:
+            # ATTACH/DETACH are not allowed inside a transaction; fail before
+            # touching the caller's open transaction
+            if self._tx_depth:
+                raise RuntimeError("load_seed() must be called outside a transaction")
+            self._conn.execute("ATTACH DATABASE ? AS seed", (str(seed_path),))
+            try:
+                with self.get_connection() as conn:
+                    conn.execute("DELETE FROM calendar_entries")
+                    conn.execute("DELETE FROM weather_cache")
+                    count = conn.execute(_SQL_COPY_SEED_ENTRIES, (modifier,)).rowcount
+                    conn.execute(_SQL_COPY_SEED_WEATHER, (modifier,))
+            finally:
+                self._conn.execute("DETACH DATABASE seed")
+        
+        self._invalidate_caches(clear_all=True)
+        return count
+    
     def clear_weather_cache(self):
         """Clear all cached weather data."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM weather_cache")
+        
+        self._invalidate_caches(clear_all=True)
+        
+        # Fold the WAL back into the main file so it doesn't keep growing
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
@@ -0,0 +1,27 @@
+"""Build the dummy data seed database (data/dev_seed.db).
+
+Run once at build/packaging time:
+    python scripts/build_dev_seed.py [output_path]
+
+`python utils/dummy_data.py` then loads the seed, shifted to the current
+week, instead of regenerating and inserting every entry.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the app's top-level packages (models, utils, ...) importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.dummy_data import DEV_SEED_PATH, SEED_START_DATE, build_dev_seed
+
+
+def main():
+    """Build the seed database at the given path (default: DEV_SEED_PATH)."""
+    seed_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEV_SEED_PATH
+    build_dev_seed(seed_path)
+    print(f"Seed database for week of {SEED_START_DATE.isoformat()} written to {seed_path}")
+
+
+if __name__ == "__main__":
+    main()
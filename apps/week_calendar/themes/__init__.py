@@ -0,0 +1 @@
+"""Themes package."""
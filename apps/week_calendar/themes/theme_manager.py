@@ -5,10 +5,13 @@ Handles loading, saving, and applying themes with colors, fonts, and decorations
 Supports custom user themes and preset themes.
 """
 
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, astuple, field, fields, replace
+
+from utils.fast_json import json_loads, json_dumps_bytes
 
 
 @dataclass
@@ -86,6 +89,17 @@ class ThemeDecoration:
     sticker_images: List[str] = field(default_factory=list)  # Decorative stickers
 
 
+# Field names in dataclass (astuple) order, captured once
+_COLOR_FIELDS = tuple(f.name for f in fields(ThemeColors))
+_FONT_FIELDS = tuple(f.name for f in fields(ThemeFont))
+_DECORATION_FIELDS = tuple(f.name for f in fields(ThemeDecoration))
+
+# Same names as sets, for filtering unknown keys out of theme files
+_COLOR_NAMES = frozenset(_COLOR_FIELDS)
+_FONT_NAMES = frozenset(_FONT_FIELDS)
+_DECORATION_NAMES = frozenset(_DECORATION_FIELDS)
+
+
 @dataclass
 class Theme:
     """Complete theme definition."""
@@ -114,24 +128,44 @@ class Theme:
     def to_dict(self) -> dict:
         """Convert theme to dictionary.
         
+        Field values are immutable scalars (plus one list, copied below), so
+        no deep copy is needed, unlike dataclasses.asdict().
+        
         Returns:
             Theme as dictionary
         """
+        decoration = {name: getattr(self.decoration, name) for name in _DECORATION_FIELDS}
+        decoration["sticker_images"] = list(decoration["sticker_images"])
+        
         return {
             "name": self.name,
             "display_name": self.display_name,
             "description": self.description,
             "author": self.author,
             "is_custom": self.is_custom,
-            "colors": asdict(self.colors),
-            "font": asdict(self.font),
-            "decoration": asdict(self.decoration)
+            "colors": {name: getattr(self.colors, name) for name in _COLOR_FIELDS},
+            "font": {name: getattr(self.font, name) for name in _FONT_FIELDS},
+            "decoration": decoration
         }
     
+    def clone(self) -> 'Theme':
+        """Create a lightweight copy of this theme.
+        
+        Only the font is copied; colors and decoration are shared with the
+        original since appearance overrides never modify them.
+        
+        Returns:
+            New Theme instance
+        """
+        return replace(self, font=replace(self.font))
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'Theme':
         """Create theme from dictionary.
         
+        Unknown keys in the colors/font/decoration sections (e.g. from an
+        older or newer theme file) are ignored instead of raising TypeError.
+        
         Args:
             data: Theme data dictionary
             
@@ -148,262 +182,284 @@ class Theme:
             description=data.get("description", ""),
             author=data.get("author", "System"),
             is_custom=data.get("is_custom", False),
-            colors=ThemeColors(**colors_data),
-            font=ThemeFont(**font_data),
-            decoration=ThemeDecoration(**decoration_data)
+            colors=ThemeColors(**{k: v for k, v in colors_data.items() if k in _COLOR_NAMES}),
+            font=ThemeFont(**{k: v for k, v in font_data.items() if k in _FONT_NAMES}),
+            decoration=ThemeDecoration(
+                **{k: v for k, v in decoration_data.items() if k in _DECORATION_NAMES}
+            )
         )
     
     def generate_stylesheet(self) -> str:
         """Generate PyQt5 stylesheet from theme.
         
+        Output depends only on the color and font values, so it is memoized
+        by those (see _render_stylesheet). Mutating a theme in place simply
+        produces a different cache key.
+        
         Returns:
             Complete stylesheet string
         """
-        c = self.colors
-        f = self.font
-        
-        stylesheet = f"""
-            /* Main Window */
-            QMainWindow {{
-                background-color: {c.background};
-                color: {c.text_primary};
-                font-family: {f.family};
-                font-size: {f.size_normal}px;
-            }}
-            
-            /* Generic Widget */
-            QWidget {{
-                background-color: {c.background};
-                color: {c.text_primary};
-                font-family: {f.family};
-            }}
-            
-            /* Buttons */
-            QPushButton {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                border: 1px solid {c.border};
-                border-radius: 8px;
-                padding: 10px;
-                font-size: {f.size_normal}px;
-                font-weight: {f.weight_bold};
-            }}
-            
-            QPushButton:hover {{
-                background-color: {c.background_hover};
-            }}
-            
-            QPushButton:pressed {{
-                background-color: {c.accent};
-            }}
-            
-            QPushButton:disabled {{
-                background-color: {c.background_secondary};
-                color: {c.text_disabled};
-            }}
-            
-            /* Labels */
-            QLabel {{
-                color: {c.text_primary};
-                background-color: transparent;
-                font-size: {f.size_normal}px;
-            }}
-            
-            /* Input Fields */
-            QLineEdit, QTextEdit, QPlainTextEdit {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                border: 1px solid {c.border};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: {f.size_normal}px;
-            }}
-            
-            QLineEdit:focus, QTextEdit:focus {{
-                border: 2px solid {c.accent};
-            }}
-            
-            /* Combo Boxes */
-            QComboBox {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                border: 1px solid {c.border};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: {f.size_normal}px;
-            }}
-            
-            QComboBox:hover {{
-                background-color: {c.background_hover};
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                selection-background-color: {c.accent};
-                border: 1px solid {c.border};
-            }}
-            
-            /* Check Boxes */
-            QCheckBox {{
-                color: {c.text_primary};
-                spacing: 8px;
-                font-size: {f.size_normal}px;
-            }}
-            
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {c.border};
-                border-radius: 3px;
-                background-color: {c.background_secondary};
-            }}
-            
-            QCheckBox::indicator:checked {{
-                background-color: {c.accent};
-                border-color: {c.accent};
-            }}
-            
-            /* Spin Boxes */
-            QSpinBox, QDoubleSpinBox {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                border: 1px solid {c.border};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: {f.size_normal}px;
-            }}
-            
-            /* Group Boxes */
-            QGroupBox {{
-                color: {c.text_primary};
-                border: 2px solid {c.border};
-                border-radius: 8px;
-                margin-top: 10px;
-                font-size: {f.size_normal}px;
-                font-weight: {f.weight_bold};
-                padding-top: 10px;
-            }}
-            
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                color: {c.accent};
-            }}
-            
-            /* List Widgets */
-            QListWidget {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                border: 1px solid {c.border};
-                border-radius: 4px;
-                font-size: {f.size_normal}px;
-            }}
-            
-            QListWidget::item:selected {{
-                background-color: {c.accent};
-                color: {c.text_primary};
-            }}
-            
-            QListWidget::item:hover {{
-                background-color: {c.background_hover};
-            }}
-            
-            /* Tab Widget */
-            QTabWidget::pane {{
-                border: 1px solid {c.border};
-                border-radius: 4px;
-                background-color: {c.background};
-            }}
-            
-            QTabBar::tab {{
-                background-color: {c.background_secondary};
-                color: {c.text_secondary};
-                border: 1px solid {c.border};
-                padding: 8px 16px;
-                font-size: {f.size_normal}px;
-            }}
-            
-            QTabBar::tab:selected {{
-                background-color: {c.accent};
-                color: {c.text_primary};
-            }}
-            
-            QTabBar::tab:hover {{
-                background-color: {c.background_hover};
-            }}
-            
-            /* Scroll Bars */
-            QScrollBar:vertical {{
-                background-color: {c.background_secondary};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {c.accent};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: {c.accent_hover};
-            }}
-            
-            QScrollBar:horizontal {{
-                background-color: {c.background_secondary};
-                height: 12px;
-                border-radius: 6px;
-            }}
-            
-            QScrollBar::handle:horizontal {{
-                background-color: {c.accent};
-                border-radius: 6px;
-                min-width: 20px;
-            }}
-            
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {c.accent_hover};
-            }}
-            
-            QScrollBar::add-line, QScrollBar::sub-line {{
-                height: 0px;
-                width: 0px;
-            }}
-            
-            /* Dialogs */
-            QDialog {{
-                background-color: {c.background};
-                color: {c.text_primary};
-            }}
-            
-            /* Message Box */
-            QMessageBox {{
-                background-color: {c.background};
-                color: {c.text_primary};
-            }}
-            
-            QMessageBox QPushButton {{
-                min-width: 80px;
-            }}
-            
-            /* Tool Tip */
-            QToolTip {{
-                background-color: {c.background_secondary};
-                color: {c.text_primary};
-                border: 1px solid {c.border};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: {f.size_small}px;
-            }}
-        """
+        return _render_stylesheet(astuple(self.colors), astuple(self.font))
+
+
+# Application stylesheet; placeholders are ThemeColors/ThemeFont field names.
+# Built once at import; each render is a single str.format_map call.
+_QSS_TEMPLATE = """
+    /* Main Window */
+    QMainWindow {{
+        background-color: {background};
+        color: {text_primary};
+        font-family: {family};
+        font-size: {size_normal}px;
+    }}
+    
+    /* Generic Widget */
+    QWidget {{
+        background-color: {background};
+        color: {text_primary};
+        font-family: {family};
+    }}
+    
+    /* Buttons */
+    QPushButton {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        border: 1px solid {border};
+        border-radius: 8px;
+        padding: 10px;
+        font-size: {size_normal}px;
+        font-weight: {weight_bold};
+    }}
+    
+    QPushButton:hover {{
+        background-color: {background_hover};
+    }}
+    
+    QPushButton:pressed {{
+        background-color: {accent};
+    }}
+    
+    QPushButton:disabled {{
+        background-color: {background_secondary};
+        color: {text_disabled};
+    }}
+    
+    /* Labels */
+    QLabel {{
+        color: {text_primary};
+        background-color: transparent;
+        font-size: {size_normal}px;
+    }}
+    
+    /* Input Fields */
+    QLineEdit, QTextEdit, QPlainTextEdit {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 5px;
+        font-size: {size_normal}px;
+    }}
+    
+    QLineEdit:focus, QTextEdit:focus {{
+        border: 2px solid {accent};
+    }}
+    
+    /* Combo Boxes */
+    QComboBox {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 5px;
+        font-size: {size_normal}px;
+    }}
+    
+    QComboBox:hover {{
+        background-color: {background_hover};
+    }}
+    
+    QComboBox::drop-down {{
+        border: none;
+    }}
+    
+    QComboBox QAbstractItemView {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        selection-background-color: {accent};
+        border: 1px solid {border};
+    }}
+    
+    /* Check Boxes */
+    QCheckBox {{
+        color: {text_primary};
+        spacing: 8px;
+        font-size: {size_normal}px;
+    }}
+    
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border: 2px solid {border};
+        border-radius: 3px;
+        background-color: {background_secondary};
+    }}
+    
+    QCheckBox::indicator:checked {{
+        background-color: {accent};
+        border-color: {accent};
+    }}
+    
+    /* Spin Boxes */
+    QSpinBox, QDoubleSpinBox {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 5px;
+        font-size: {size_normal}px;
+    }}
+    
+    /* Group Boxes */
+    QGroupBox {{
+        color: {text_primary};
+        border: 2px solid {border};
+        border-radius: 8px;
+        margin-top: 10px;
+        font-size: {size_normal}px;
+        font-weight: {weight_bold};
+        padding-top: 10px;
+    }}
+    
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+        color: {accent};
+    }}
+    
+    /* List Widgets */
+    QListWidget {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        border: 1px solid {border};
+        border-radius: 4px;
+        font-size: {size_normal}px;
+    }}
+    
+    QListWidget::item:selected {{
+        background-color: {accent};
+        color: {text_primary};
+    }}
+    
+    QListWidget::item:hover {{
+        background-color: {background_hover};
+    }}
+    
+    /* Tab Widget */
+    QTabWidget::pane {{
+        border: 1px solid {border};
+        border-radius: 4px;
+        background-color: {background};
+    }}
+    
+    QTabBar::tab {{
+        background-color: {background_secondary};
+        color: {text_secondary};
+        border: 1px solid {border};
+        padding: 8px 16px;
+        font-size: {size_normal}px;
+    }}
+    
+    QTabBar::tab:selected {{
+        background-color: {accent};
+        color: {text_primary};
+    }}
+    
+    QTabBar::tab:hover {{
+        background-color: {background_hover};
+    }}
+    
+    /* Scroll Bars */
+    QScrollBar:vertical {{
+        background-color: {background_secondary};
+        width: 12px;
+        border-radius: 6px;
+    }}
+    
+    QScrollBar::handle:vertical {{
+        background-color: {accent};
+        border-radius: 6px;
+        min-height: 20px;
+    }}
+    
+    QScrollBar::handle:vertical:hover {{
+        background-color: {accent_hover};
+    }}
+    
+    QScrollBar:horizontal {{
+        background-color: {background_secondary};
+        height: 12px;
+        border-radius: 6px;
+    }}
+    
+    QScrollBar::handle:horizontal {{
+        background-color: {accent};
+        border-radius: 6px;
+        min-width: 20px;
+    }}
+    
+    QScrollBar::handle:horizontal:hover {{
+        background-color: {accent_hover};
+    }}
+    
+    QScrollBar::add-line, QScrollBar::sub-line {{
+        height: 0px;
+        width: 0px;
+    }}
+    
+    /* Dialogs */
+    QDialog {{
+        background-color: {background};
+        color: {text_primary};
+    }}
+    
+    /* Message Box */
+    QMessageBox {{
+        background-color: {background};
+        color: {text_primary};
+    }}
+    
+    QMessageBox QPushButton {{
+        min-width: 80px;
+    }}
+    
+    /* Tool Tip */
+    QToolTip {{
+        background-color: {background_secondary};
+        color: {text_primary};
+        border: 1px solid {border};
+        border-radius: 4px;
+        padding: 5px;
+        font-size: {size_small}px;
+    }}
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _render_stylesheet(colors_values: tuple, font_values: tuple) -> str:
+    """Build the application stylesheet for the given color/font values.
+    
+    Args:
+        colors_values: ThemeColors field values (dataclasses.astuple order)
+        font_values: ThemeFont field values (dataclasses.astuple order)
         
-        return stylesheet
+    Returns:
+        Complete stylesheet string
+    """
+    params = dict(zip(_COLOR_FIELDS, colors_values))
+    params.update(zip(_FONT_FIELDS, font_values))
+    return _QSS_TEMPLATE.format_map(params)
 
 
 class ThemeManager:
@@ -418,30 +474,22 @@ class ThemeManager:
         self.themes_dir.mkdir(parents=True, exist_ok=True)
         self.custom_themes_dir.mkdir(parents=True, exist_ok=True)
         
+        # Theme files are only indexed up front; bodies are parsed on demand
+        self._theme_paths: Dict[str, Tuple[Path, bool]] = {}  # name -> (path, is_custom)
         self._themes: Dict[str, Theme] = {}
         self._load_all_themes()
     
     def _load_all_themes(self):
-        """Load all themes from preset and custom directories."""
-        # Load preset themes
+        """Index theme files in the preset and custom directories.
+        
+        Themes are keyed by file stem (files are saved as <name>.json);
+        custom themes shadow presets of the same name.
+        """
         for theme_file in self.themes_dir.glob("*.json"):
-            try:
-                theme = self._load_theme_file(theme_file)
-                if theme:
-                    theme.is_custom = False
-                    self._themes[theme.name] = theme
-            except Exception as e:
-                print(f"Error loading preset theme {theme_file}: {e}")
+            self._theme_paths[theme_file.stem] = (theme_file, False)
         
-        # Load custom themes
         for theme_file in self.custom_themes_dir.glob("*.json"):
-            try:
-                theme = self._load_theme_file(theme_file)
-                if theme:
-                    theme.is_custom = True
-                    self._themes[theme.name] = theme
-            except Exception as e:
-                print(f"Error loading custom theme {theme_file}: {e}")
+            self._theme_paths[theme_file.stem] = (theme_file, True)
     
     def _load_theme_file(self, path: Path) -> Optional[Theme]:
         """Load theme from JSON file.
@@ -453,9 +501,9 @@ class ThemeManager:
             Theme instance or None if loading failed
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return Theme.from_dict(data)
+            # One read syscall; the parser consumes UTF-8 bytes directly
+            data = json_loads(path.read_bytes())
+            return Theme.from_dict(data)
         except Exception as e:
             print(f"Error loading theme from {path}: {e}")
             return None
@@ -469,7 +517,51 @@ class ThemeManager:
         Returns:
             Theme instance or None if not found
         """
-        return self._themes.get(name)
+        theme = self._themes.get(name)
+        if theme is None:
+            entry = self._theme_paths.get(name)
+            if entry is None:
+                return None
+            path, is_custom = entry
+            theme = self._load_theme_file(path)
+            if theme is None:
+                return None
+            theme.is_custom = is_custom
+            self._themes[name] = theme
+        return theme
+    
+    def _get_themes(self, is_custom: Optional[bool] = None) -> List[Theme]:
+        """Load (if needed) and return indexed themes, optionally filtered.
+        
+        Args:
+            is_custom: Only return custom (True) or preset (False) themes;
+                       None returns both
+            
+        Returns:
+            List of themes that loaded successfully
+        """
+        names = [
+            name for name, (_path, custom) in self._theme_paths.items()
+            if is_custom is None or custom == is_custom
+        ]
+        
+        # Parse not-yet-loaded files concurrently (overlaps file I/O)
+        pending = [name for name in names if name not in self._themes]
+        if len(pending) > 1:
+            paths = [self._theme_paths[name][0] for name in pending]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                loaded = list(executor.map(self._load_theme_file, paths))
+            for name, theme in zip(pending, loaded):
+                if theme is not None:
+                    theme.is_custom = self._theme_paths[name][1]
+                    self._themes[name] = theme
+        
+        themes = []
+        for name in names:
+            theme = self.get_theme(name)
+            if theme is not None:
+                themes.append(theme)
+        return themes
     
     def get_all_themes(self) -> List[Theme]:
         """Get list of all available themes.
@@ -477,7 +569,7 @@ class ThemeManager:
         Returns:
             List of all themes
         """
-        return list(self._themes.values())
+        return self._get_themes()
     
     def get_preset_themes(self) -> List[Theme]:
         """Get list of preset (non-custom) themes.
@@ -485,7 +577,7 @@ class ThemeManager:
         Returns:
             List of preset themes
         """
-        return [t for t in self._themes.values() if not t.is_custom]
+        return self._get_themes(is_custom=False)
     
     def get_custom_themes(self) -> List[Theme]:
         """Get list of custom user themes.
@@ -493,7 +585,7 @@ class ThemeManager:
         Returns:
             List of custom themes
         """
-        return [t for t in self._themes.values() if t.is_custom]
+        return self._get_themes(is_custom=True)
     
     def save_custom_theme(self, theme: Theme) -> bool:
         """Save a custom theme.
@@ -508,10 +600,10 @@ class ThemeManager:
             theme.is_custom = True
             theme_path = self.custom_themes_dir / f"{theme.name}.json"
             
-            with open(theme_path, 'w', encoding='utf-8') as f:
-                json.dump(theme.to_dict(), f, indent=2, ensure_ascii=False)
+            theme_path.write_bytes(json_dumps_bytes(theme.to_dict(), indent=True))
             
             # Add/update in memory
+            self._theme_paths[theme.name] = (theme_path, True)
             self._themes[theme.name] = theme
             return True
         except Exception as e:
@@ -527,8 +619,8 @@ class ThemeManager:
         Returns:
             True if successful, False otherwise
         """
-        theme = self._themes.get(name)
-        if not theme or not theme.is_custom:
+        entry = self._theme_paths.get(name)
+        if not entry or not entry[1]:
             return False
         
         try:
@@ -537,7 +629,8 @@ class ThemeManager:
                 theme_path.unlink()
             
             # Remove from memory
-            del self._themes[name]
+            del self._theme_paths[name]
+            self._themes.pop(name, None)
             return True
         except Exception as e:
             print(f"Error deleting theme: {e}")
@@ -545,6 +638,7 @@ class ThemeManager:
     
     def reload_themes(self):
         """Reload all themes from disk."""
+        self._theme_paths.clear()
         self._themes.clear()
         self._load_all_themes()
 
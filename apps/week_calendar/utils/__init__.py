@@ -2,12 +2,19 @@
 
 from .dummy_data import populate_database_with_dummy_data, populate_weather_cache
 from .weather_api import WeatherAPI, fetch_and_cache_weather
-from .location import get_location_from_ip
+from .location import (
+    get_cached_location, get_location_from_ip, get_location_from_ip_async, prefetch_location,
+    shutdown_location_lookups
+)
 
 __all__ = [
     'populate_database_with_dummy_data',
     'populate_weather_cache', 
     'WeatherAPI',
     'fetch_and_cache_weather',
-    'get_location_from_ip'
+    'get_cached_location',
+    'get_location_from_ip',
+    'get_location_from_ip_async',
+    'prefetch_location',
+    'shutdown_location_lookups'
 ]
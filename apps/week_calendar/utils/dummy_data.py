@@ -5,12 +5,68 @@ Creates realistic school schedule and sample events.
 """
 
 from datetime import date, time, timedelta
+from itertools import cycle
+from pathlib import Path
 from typing import List
 import uuid
 
 from models.calendar_entry import CalendarEntry, get_default_icon, get_default_color
 
 
+def _template(title: str, category: str, description: str,
+              start_time: time = None, end_time: time = None,
+              is_special: bool = False) -> dict:
+    """Build the invariant CalendarEntry fields for a recurring dummy event."""
+    return {
+        "title": title,
+        "category": category,
+        "start_time": start_time,
+        "end_time": end_time,
+        "icon": get_default_icon(category),
+        "color": get_default_color(category),
+        "description": description,
+        "is_special": is_special
+    }
+
+
+# Everything except the date is fixed per event kind, so category icon/color
+# lookups and time() construction happen once at import
+_TEMPLATES = {
+    "school": _template("School", "School", "Regular school day",
+                        time(8, 0), time(15, 0)),
+    "soccer_practice": _template("Soccer Practice", "Sports", "Bring cleats and water bottle",
+                                 time(15, 30), time(17, 0)),
+    "piano_lesson": _template("Piano Lesson", "Music", "Practice scales",
+                              time(17, 30), time(18, 30)),
+    "doctor_checkup": _template("Doctor Checkup", "Appointments", "Annual checkup with Dr. Smith",
+                                time(16, 0), time(17, 0)),
+    "soccer_game": _template("Soccer Game", "Sports", "Home game vs. Blue Team",
+                             time(10, 0), time(11, 30)),
+    "emma_birthday": _template("Emma's Birthday Party", "Birthday", "Bring present! Party at the park",
+                               time(14, 0), time(16, 0), is_special=True),
+    "dad_birthday": _template("Dad's Birthday", "Birthday", "🎂 Don't forget to make card!",
+                              is_special=True),
+    "school_holiday": _template("School Holiday", "Holiday", "No school - woohoo!",
+                                is_special=True)
+}
+
+
+# Weekly timetable as (template kind, weekday) with 0=Monday; each slot is
+# stored once as a weekly recurring entry rather than once per week
+_WEEKLY_SCHEDULE = (
+    ("school", 0), ("school", 1), ("school", 2), ("school", 3), ("school", 4),
+    ("soccer_practice", 0), ("piano_lesson", 0),
+    ("soccer_practice", 2), ("piano_lesson", 2),
+    ("soccer_practice", 4),
+    ("soccer_game", 5)
+)
+
+
+def _entry(kind: str, entry_date: date, **overrides) -> CalendarEntry:
+    """Create a dummy entry of the given template kind on entry_date."""
+    return CalendarEntry(entry_date=entry_date, **_TEMPLATES[kind], **overrides)
+
+
 def generate_dummy_data(start_date: date = None, weeks: int = 4) -> List[CalendarEntry]:
     """Generate dummy calendar entries for testing.
     
@@ -26,155 +82,38 @@ def generate_dummy_data(start_date: date = None, weeks: int = 4) -> List[Calenda
     
     entries = []
     
-    # Generate entries for each week
-    for week in range(weeks):
-        week_start = start_date + timedelta(weeks=week)
+    if weeks > 0:
+        # Monday of the first and of the last generated week
+        first_monday = start_date - timedelta(days=start_date.weekday())
+        last_monday = first_monday + timedelta(weeks=weeks - 1)
         
-        # Find Monday of this week
-        monday = week_start - timedelta(days=week_start.weekday())
+        # Regular timetable, recurring weekly through the last week
+        entries.extend([
+            _entry(kind, first_monday + timedelta(days=weekday),
+                   recurring="weekly",
+                   recurring_end_date=last_monday + timedelta(days=weekday))
+            for kind, weekday in _WEEKLY_SCHEDULE
+        ])
         
-        # School days (Monday - Friday)
-        for day in range(5):  # 0=Monday, 4=Friday
-            current_date = monday + timedelta(days=day)
+        if weeks > 1:
+            second_monday = first_monday + timedelta(weeks=1)
             
-            # School (recurring Monday-Friday)
-            entries.append(CalendarEntry(
-                title="School",
-                date=current_date,
-                start_time=time(8, 0),
-                end_time=time(15, 0),
-                category="School",
-                icon=get_default_icon("School"),
-                color=get_default_color("School"),
-                description="Regular school day"
-            ))
-        
-        # Monday activities
-        monday_date = monday
-        entries.append(CalendarEntry(
-            title="Soccer Practice",
-            date=monday_date,
-            start_time=time(15, 30),
-            end_time=time(17, 0),
-            category="Sports",
-            icon=get_default_icon("Sports"),
-            color=get_default_color("Sports"),
-            description="Bring cleats and water bottle"
-        ))
-        entries.append(CalendarEntry(
-            title="Piano Lesson",
-            date=monday_date,
-            start_time=time(17, 30),
-            end_time=time(18, 30),
-            category="Music",
-            icon=get_default_icon("Music"),
-            color=get_default_color("Music"),
-            description="Practice scales"
-        ))
-        
-        # Wednesday activities
-        wednesday_date = monday + timedelta(days=2)
-        entries.append(CalendarEntry(
-            title="Soccer Practice",
-            date=wednesday_date,
-            start_time=time(15, 30),
-            end_time=time(17, 0),
-            category="Sports",
-            icon=get_default_icon("Sports"),
-            color=get_default_color("Sports"),
-            description="Bring cleats and water bottle"
-        ))
-        entries.append(CalendarEntry(
-            title="Piano Lesson",
-            date=wednesday_date,
-            start_time=time(17, 30),
-            end_time=time(18, 30),
-            category="Music",
-            icon=get_default_icon("Music"),
-            color=get_default_color("Music"),
-            description="Practice scales"
-        ))
-        
-        # Thursday: Doctor appointment (only first week)
-        if week == 1:
-            thursday_date = monday + timedelta(days=3)
-            entries.append(CalendarEntry(
-                title="Doctor Checkup",
-                date=thursday_date,
-                start_time=time(16, 0),
-                end_time=time(17, 0),
-                category="Appointments",
-                icon=get_default_icon("Appointments"),
-                color=get_default_color("Appointments"),
-                description="Annual checkup with Dr. Smith"
-            ))
-        
-        # Friday activities
-        friday_date = monday + timedelta(days=4)
-        entries.append(CalendarEntry(
-            title="Soccer Practice",
-            date=friday_date,
-            start_time=time(15, 30),
-            end_time=time(17, 0),
-            category="Sports",
-            icon=get_default_icon("Sports"),
-            color=get_default_color("Sports"),
-            description="Bring cleats and water bottle"
-        ))
-        
-        # Saturday: Soccer game
-        saturday_date = monday + timedelta(days=5)
-        entries.append(CalendarEntry(
-            title="Soccer Game",
-            date=saturday_date,
-            start_time=time(10, 0),
-            end_time=time(11, 30),
-            category="Sports",
-            icon=get_default_icon("Sports"),
-            color=get_default_color("Sports"),
-            description="Home game vs. Blue Team"
-        ))
-        
-        # Saturday: Birthday party (only second week)
-        if week == 1:
-            entries.append(CalendarEntry(
-                title="Emma's Birthday Party",
-                date=saturday_date,
-                start_time=time(14, 0),
-                end_time=time(16, 0),
-                category="Birthday",
-                icon=get_default_icon("Birthday"),
-                color=get_default_color("Birthday"),
-                description="Bring present! Party at the park",
-                is_special=True
-            ))
+            # Thursday: Doctor appointment (second week only)
+            entries.append(_entry("doctor_checkup", second_monday + timedelta(days=3)))
+            
+            # Saturday: Birthday party (second week only)
+            entries.append(_entry("emma_birthday", second_monday + timedelta(days=5)))
     
     # Add some special events (birthdays, holidays)
     
     # Birthday - 15 days from start
     birthday_date = start_date + timedelta(days=15)
-    entries.append(CalendarEntry(
-        title="Dad's Birthday",
-        date=birthday_date,
-        category="Birthday",
-        icon=get_default_icon("Birthday"),
-        color=get_default_color("Birthday"),
-        description="🎂 Don't forget to make card!",
-        is_special=True
-    ))
+    entries.append(_entry("dad_birthday", birthday_date))
     
     # Holiday - 20 days from start (if within range)
     if weeks >= 3:
         holiday_date = start_date + timedelta(days=20)
-        entries.append(CalendarEntry(
-            title="School Holiday",
-            date=holiday_date,
-            category="Holiday",
-            icon=get_default_icon("Holiday"),
-            color=get_default_color("Holiday"),
-            description="No school - woohoo!",
-            is_special=True
-        ))
+        entries.append(_entry("school_holiday", holiday_date))
     
     return entries
 
@@ -189,10 +128,18 @@ def populate_database_with_dummy_data(database, start_date: date = None, weeks:
     """
     entries = generate_dummy_data(start_date, weeks)
     
-    for entry in entries:
-        database.add_entry(entry.to_dict())
+    count = database.add_entry_rows(entry.as_row_tuple() for entry in entries)
     
-    print(f"Added {len(entries)} dummy calendar entries to database")
+    print(f"Added {count} dummy calendar entries to database")
+
+
+# Repeating icon sequence for dummy weather, and each icon's file name and
+# description (derived once rather than per generated day)
+_WEATHER_ICONS = ("sunny", "cloudy", "rainy", "partly_cloudy", "sunny")
+_WEATHER_META = {
+    icon: (f"{icon}.png", icon.replace('_', ' ').title())
+    for icon in _WEATHER_ICONS
+}
 
 
 def generate_dummy_weather(start_date: date = None, days: int = 14) -> List[dict]:
@@ -208,19 +155,17 @@ def generate_dummy_weather(start_date: date = None, days: int = 14) -> List[dict
     if start_date is None:
         start_date = date.today()
     
-    weather_icons = ["sunny", "cloudy", "rainy", "partly_cloudy", "sunny"]
     weather_data = []
     
-    for day in range(days):
-        current_date = start_date + timedelta(days=day)
-        icon = weather_icons[day % len(weather_icons)]
+    for day, icon in zip(range(days), cycle(_WEATHER_ICONS)):
+        icon_file, description = _WEATHER_META[icon]
         
         weather_data.append({
-            'date': current_date.isoformat(),
-            'icon': f"{icon}.png",
+            'date': (start_date + timedelta(days=day)).isoformat(),
+            'icon': icon_file,
             'temperature_high': 65 + (day % 15),
             'temperature_low': 50 + (day % 10),
-            'description': icon.replace('_', ' ').title()
+            'description': description
         })
     
     return weather_data
@@ -236,10 +181,68 @@ def populate_weather_cache(database, start_date: date = None, days: int = 14):
     """
     weather_data = generate_dummy_weather(start_date, days)
     
-    for weather in weather_data:
-        database.cache_weather(weather)
+    count = database.cache_weather_bulk(weather_data)
+    
+    print(f"Added {count} days of dummy weather data to cache")
+
+
+# Prebuilt seed database (see scripts/build_dev_seed.py). It is generated
+# for a fixed Monday and rebased onto the current week when loaded.
+DEV_SEED_PATH = Path(__file__).parent.parent / "data" / "dev_seed.db"
+SEED_START_DATE = date(2024, 1, 1)  # A Monday
+SEED_WEEKS = 4
+SEED_WEATHER_DAYS = 14
+
+
+def build_dev_seed(seed_path: Path = DEV_SEED_PATH):
+    """Generate the dummy data seed database at SEED_START_DATE.
+    
+    Args:
+        seed_path: Output SQLite file (replaced if it exists)
+    """
+    from models.database import CalendarDatabase
+    
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            Path(f"{seed_path}{suffix}").unlink()
+        except FileNotFoundError:
+            pass
     
-    print(f"Added {len(weather_data)} days of dummy weather data to cache")
+    database = CalendarDatabase(seed_path)
+    try:
+        # The seed file is rebuilt from scratch, so it can skip fsyncs
+        with database.bulk_seed(durable=False):
+            populate_database_with_dummy_data(database, SEED_START_DATE, weeks=SEED_WEEKS)
+            populate_weather_cache(database, SEED_START_DATE, days=SEED_WEATHER_DAYS)
+    finally:
+        # Closing the last connection folds the WAL into the seed file
+        database.close()
+
+
+def populate_from_dev_seed(database, start_date: date = None) -> bool:
+    """Replace entries and weather with the prebuilt seed, moved to start_date.
+    
+    Dates are shifted by whole weeks so the weekly timetable keeps its
+    weekdays; one-off events keep their offset from the seed's Monday.
+    
+    Args:
+        database: CalendarDatabase instance
+        start_date: Date whose week the seed is moved to (defaults to today)
+        
+    Returns:
+        True if the seed was loaded, False if no seed file exists
+    """
+    if not DEV_SEED_PATH.exists():
+        return False
+    
+    if start_date is None:
+        start_date = date.today()
+    
+    monday = start_date - timedelta(days=start_date.weekday())
+    count = database.load_seed(DEV_SEED_PATH, (monday - SEED_START_DATE).days)
+    
+    print(f"Loaded {count} dummy calendar entries from {DEV_SEED_PATH.name}")
+    return True
 
 
 if __name__ == "__main__":
@@ -247,11 +250,14 @@ if __name__ == "__main__":
     from models.database import CalendarDatabase
     
     db = CalendarDatabase()
-    db.clear_all_entries()
-    db.clear_weather_cache()
     
-    populate_database_with_dummy_data(db, weeks=4)
-    populate_weather_cache(db, days=14)
+    if not populate_from_dev_seed(db):
+        db.clear_all_entries()
+        db.clear_weather_cache()
+        
+        with db.bulk_seed():
+            populate_database_with_dummy_data(db, weeks=SEED_WEEKS)
+            populate_weather_cache(db, days=SEED_WEATHER_DAYS)
     
     print("\nDummy data generation complete!")
     print("Database location:", db.db_path)
@@ -0,0 +1,41 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson is an optional dependency (noticeably faster parsing on the Pi);
+without it these fall back to the standard library with the same results.
+
+Usage:
+    from utils.fast_json import json_loads, json_dumps_bytes
+
+    data = json_loads(path.read_bytes())
+    path.write_bytes(json_dumps_bytes(data, indent=True))
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# json_loads(str | bytes) -> object
+if orjson is not None:
+    json_loads = orjson.loads
+else:
+    json_loads = json.loads
+
+
+def json_dumps_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
@@ -11,35 +11,119 @@ Usage:
     title = t('app.title')
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Optional
 
+from utils.fast_json import json_loads, json_dumps_bytes
+
+
+def _flatten(data: dict, prefix: str = '', out: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Flatten nested translation dicts into dot-notation keys.
+    
+    Args:
+        data: Nested translation dict as loaded from a language file
+        prefix: Key prefix for the current nesting level
+        out: Dict to collect results in
+        
+    Returns:
+        Dict mapping e.g. 'app.title' to its string
+    """
+    if out is None:
+        out = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _flatten(value, f"{prefix}{key}.", out)
+        else:
+            out[prefix + key] = value
+    return out
+
 
 class TranslationManager:
     """Manages translations for multiple languages."""
     
     def __init__(self):
         """Initialize translation manager."""
-        self.translations: Dict[str, Dict] = {}
+        self.translations: Dict[str, Dict[str, str]] = {}  # lang -> flat key -> text (loaded so far)
         self.current_language = 'de'  # Default: German
+        self._resolved: Dict[str, str] = {}  # key -> text for current_language
         self.translations_dir = Path(__file__).parent.parent / 'translations'
-        self._load_all_translations()
+        self.cache_dir = Path(__file__).parent.parent / 'data' / 'translations_cache'
+        self._lang_files: Dict[str, Path] = {}
+        self._index_translations()
+        
+        # Only the active language and the English fallback are parsed up front
+        self._ensure_loaded(self.current_language)
+        self._ensure_loaded('en')
     
-    def _load_all_translations(self):
-        """Load all available translation files."""
+    def _index_translations(self):
+        """Find available translation files without parsing them."""
         if not self.translations_dir.exists():
             print(f"Translations directory not found: {self.translations_dir}")
             return
         
-        for lang_file in self.translations_dir.glob('*.json'):
-            lang_code = lang_file.stem
-            try:
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self.translations[lang_code] = json.load(f)
-                print(f"Loaded translations for: {lang_code}")
-            except Exception as e:
-                print(f"Error loading {lang_file}: {e}")
+        self._lang_files = {f.stem: f for f in sorted(self.translations_dir.glob('*.json'))}
+    
+    def _ensure_loaded(self, lang_code: str) -> bool:
+        """Load a language on first use.
+        
+        Uses the flattened on-disk cache when it was built from the current
+        language file, otherwise parses the file and rebuilds the cache.
+        
+        Args:
+            lang_code: Language code (e.g., 'de', 'en')
+            
+        Returns:
+            True if the language is available
+        """
+        if lang_code in self.translations:
+            return True
+        
+        lang_file = self._lang_files.get(lang_code)
+        if lang_file is None:
+            return False
+        
+        try:
+            mtime = lang_file.stat().st_mtime_ns
+        except OSError as e:
+            print(f"Error loading {lang_file}: {e}")
+            return False
+        
+        cache_path = self.cache_dir / f"{lang_code}.cache.json"
+        cached = self._read_cache(cache_path)
+        if cached is not None and cached.get('mtime') == mtime:
+            self.translations[lang_code] = cached['strings']
+            return True
+        
+        try:
+            self.translations[lang_code] = _flatten(json_loads(lang_file.read_bytes()))
+            print(f"Loaded translations for: {lang_code}")
+        except Exception as e:
+            print(f"Error loading {lang_file}: {e}")
+            return False
+        
+        self._write_cache(cache_path, mtime, self.translations[lang_code])
+        return True
+    
+    def _read_cache(self, cache_path: Path) -> Optional[dict]:
+        """Read a language's cache file, if present and readable."""
+        try:
+            return json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, cache_path: Path, mtime: int, strings: Dict[str, str]):
+        """Write a language's flattened strings for the next startup.
+        
+        Args:
+            cache_path: Cache file for the language
+            mtime: Source file mtime the strings were read at
+            strings: Flattened translations
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(json_dumps_bytes({'mtime': mtime, 'strings': strings}))
+        except OSError as e:
+            print(f"Error writing translations cache: {e}")
     
     def set_language(self, lang_code: str):
         """Set the current language.
@@ -47,8 +131,9 @@ class TranslationManager:
         Args:
             lang_code: Language code (e.g., 'de', 'en')
         """
-        if lang_code in self.translations:
+        if self._ensure_loaded(lang_code):
             self.current_language = lang_code
+            self._resolved.clear()
             print(f"Language set to: {lang_code}")
         else:
             print(f"Language '{lang_code}' not available, keeping '{self.current_language}'")
@@ -63,42 +148,31 @@ class TranslationManager:
         Returns:
             Translated string or key if not found
         """
-        # Get current language translations
-        lang_dict = self.translations.get(self.current_language, {})
+        text = self._resolved.get(key)
+        if text is None:
+            text = self._resolved[key] = self._resolve(key)
         
-        # Navigate nested keys
-        keys = key.split('.')
-        value = lang_dict
+        # Format with kwargs if provided
+        if kwargs:
+            try:
+                return text.format(**kwargs)
+            except KeyError:
+                return text
         
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                value = None
-                break
+        return text
+    
+    def _resolve(self, key: str) -> str:
+        """Look key up in the current language, then English, then itself."""
+        value = self.translations.get(self.current_language, {}).get(key)
         
         # Fallback to English if not found
         if value is None and self.current_language != 'en':
-            lang_dict = self.translations.get('en', {})
-            value = lang_dict
-            for k in keys:
-                if isinstance(value, dict):
-                    value = value.get(k)
-                else:
-                    value = None
-                    break
+            value = self.translations.get('en', {}).get(key)
         
         # Fallback to key itself
         if value is None:
             return key
         
-        # Format with kwargs if provided
-        if kwargs and isinstance(value, str):
-            try:
-                return value.format(**kwargs)
-            except KeyError:
-                return value
-        
         return str(value)
     
     def get_available_languages(self) -> Dict[str, str]:
@@ -108,10 +182,9 @@ class TranslationManager:
             Dict mapping language codes to native names
         """
         languages = {}
-        for lang_code in self.translations.keys():
-            lang_dict = self.translations[lang_code]
-            native_name = lang_dict.get('_meta', {}).get('native_name', lang_code)
-            languages[lang_code] = native_name
+        for lang_code in self._lang_files:
+            if self._ensure_loaded(lang_code):
+                languages[lang_code] = self.translations[lang_code].get('_meta.native_name', lang_code)
         return languages
 
 
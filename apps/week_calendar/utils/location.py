@@ -2,9 +2,83 @@
 Utility to get location from IP address for automatic weather location.
 """
 
-import requests
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.fast_json import json_loads, json_dumps_bytes
+
+
+log = logging.getLogger(__name__)
+
+# Location lookups are cached on disk for a day; an IP rarely moves further
+# than that and ip-api.com rate-limits anonymous callers
+_CACHE_PATH = Path(__file__).parent.parent / "data" / "location.cache.json"
+_CACHE_TTL = 24 * 60 * 60
+# Serializes cache read-modify-write between the prefetch thread and the UI
+_cache_lock = threading.Lock()
+
+# One pooled session so repeated lookups reuse DNS results and connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+
+# Lookups run here so callers on the UI thread never block on the network
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="location")
+_location_future: Optional[Future] = None
+_location_future_lock = threading.Lock()
+
+# cancel_futures is only accepted by Executor.shutdown() on Python 3.9+
+_SHUTDOWN_OPTIONS = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+
+def _read_cache() -> dict:
+    """Read the location cache file, returning {} if missing or unreadable."""
+    try:
+        return json_loads(_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _cache_get(key: str, ttl: Optional[float] = _CACHE_TTL):
+    """Return the cached value for key if it is younger than ttl (None: any age)."""
+    with _cache_lock:
+        cache = _read_cache()
+    entry = cache.get(key) if isinstance(cache, dict) else None
+    if isinstance(entry, dict) and 'data' in entry:
+        if ttl is None or time.time() - entry.get('ts', 0) < ttl:
+            return entry['data']
+    return None
+
+
+def _cache_put(key: str, data):
+    """Store data under key with the current timestamp.
+    
+    The file is rewritten via a temp file and atomic rename, so concurrent
+    readers never see a half-written cache.
+    """
+    tmp_path = _CACHE_PATH.with_suffix('.tmp')
+    with _cache_lock:
+        cache = _read_cache()
+        if not isinstance(cache, dict):
+            cache = {}
+        cache[key] = {'ts': time.time(), 'data': data}
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json_dumps_bytes(cache))
+            os.replace(tmp_path, _CACHE_PATH)
+        except OSError as e:
+            log.error("Error writing location cache: %s", e)
+
 
 def get_location_from_ip() -> Optional[Tuple[float, float, str, str]]:
     """Get location coordinates from IP address.
@@ -15,30 +89,84 @@ def get_location_from_ip() -> Optional[Tuple[float, float, str, str]]:
     Returns:
         Tuple of (latitude, longitude, city_name, timezone) or None on failure
     """
+    cached = _cache_get('ip')
+    if cached is not None:
+        return tuple(cached)
+    
     try:
         # Use ip-api.com - free, no API key needed
         url = "http://ip-api.com/json/?fields=status,lat,lon,city,timezone"
         
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        data = json_loads(response.content)
         
         if data.get('status') == 'success':
-            return (
+            location = (
                 data['lat'],
                 data['lon'],
                 data['city'],
                 data['timezone']
             )
+            _cache_put('ip', location)
+            return location
         
         return None
         
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         print(f"Error getting location from IP: {e}")
         return None
 
 
+def get_location_from_ip_async() -> Future:
+    """Start a background IP location lookup, or join the one in flight.
+    
+    A completed successful lookup is shared by later callers; a failed one
+    (no result or an exception) is retried on the next call.
+    
+    Returns:
+        Future resolving to the result of get_location_from_ip()
+    """
+    global _location_future
+    with _location_future_lock:
+        future = _location_future
+        if future is None or (
+            future.done() and (future.exception() is not None or future.result() is None)
+        ):
+            future = _location_future = _EXECUTOR.submit(get_location_from_ip)
+        return future
+
+
+def get_cached_location() -> Optional[Tuple[float, float, str, str]]:
+    """Return the last IP location stored in the disk cache, however old.
+    
+    Meant as a fallback when a live lookup is too slow; never hits the network.
+    
+    Returns:
+        Tuple of (latitude, longitude, city_name, timezone) or None if never cached
+    """
+    cached = _cache_get('ip', ttl=None)
+    return tuple(cached) if cached is not None else None
+
+
+def prefetch_location():
+    """Warm the IP location lookup in the background (e.g. at app launch)."""
+    get_location_from_ip_async()
+
+
+def shutdown_location_lookups():
+    """Stop background lookups without waiting for them (call on app exit).
+    
+    Queued lookups are cancelled; one already in flight is left to hit its
+    request timeout instead of being waited for here.
+    """
+    with _location_future_lock:
+        if _location_future is not None:
+            _location_future.cancel()
+    _EXECUTOR.shutdown(wait=False, **_SHUTDOWN_OPTIONS)
+
+
 def get_timezone_for_coordinates(latitude: float, longitude: float) -> str:
     """Get timezone for given coordinates using Open-Meteo.
     
@@ -49,6 +177,11 @@ def get_timezone_for_coordinates(latitude: float, longitude: float) -> str:
     Returns:
         Timezone string (e.g., "Europe/London") or default
     """
+    cache_key = f"tz:{latitude:.2f},{longitude:.2f}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         # Use Open-Meteo's timezone endpoint
         url = "https://api.open-meteo.com/v1/forecast"
@@ -58,13 +191,16 @@ def get_timezone_for_coordinates(latitude: float, longitude: float) -> str:
             'timezone': 'auto'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
-        return data.get('timezone', 'Europe/London')
+        data = json_loads(response.content)
+        timezone = data.get('timezone')
+        if timezone:
+            _cache_put(cache_key, timezone)
+        return timezone or 'Europe/London'
         
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         print(f"Error getting timezone: {e}")
         return "Europe/London"
 
@@ -8,20 +8,34 @@ Features:
 - PIN-protected unlock after time expires
 """
 
-from datetime import datetime, timedelta, date
-from typing import List, Optional, Callable
-import json
+from datetime import datetime, date
+from typing import Optional
+import math
 from pathlib import Path
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QDialog, QLineEdit, QHBoxLayout
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QPoint, QRect
-from PyQt5.QtGui import QFont, QPainter, QPen, QColor, QPolygon
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QDialog, QLineEdit
+from PyQt5.QtCore import QTimer, QElapsedTimer, Qt, pyqtSignal, QPoint, QRect
+from PyQt5.QtGui import QFont, QPainter, QPen, QColor, QPixmap
 
 from utils.i18n import t
+from utils.settings_cache import get_settings
 from utils.screentime_manager import ScreenTimeController
 from themes.theme_manager import Theme, ThemeColors
 
 
+# (cos, sin) of the 12 hour-marker angles (0, 30, ..., 330 degrees)
+_HOUR_MARKER_TRIG = tuple(
+    (math.cos(math.radians(i * 30)), math.sin(math.radians(i * 30)))
+    for i in range(12)
+)
+
+# (cos, sin) of the minute-hand angle for each minute value 0-59
+_MINUTE_HAND_TRIG = tuple(
+    (math.cos(math.radians(m * 6 - 90)), math.sin(math.radians(m * 6 - 90)))
+    for m in range(60)
+)
+
+
 class AnalogClockWidget(QWidget):
     """Analog clock showing remaining time."""
     
@@ -37,94 +51,140 @@ class AnalogClockWidget(QWidget):
         self.total_seconds = remaining_seconds if remaining_seconds > 0 else 3600
         self.setMinimumSize(300, 300)
         self.theme_colors = theme_colors or ThemeColors()
+        
+        # Painting resources, built once instead of on every repaint
+        c = self.theme_colors
+        self._circle_pen = QPen(QColor(c.border), 3)
+        self._arc_brush = QColor(c.accent)
+        self._arc_brush.setAlpha(120)
+        self._marker_pen = QPen(QColor(c.text_primary), 2)
+        self._hand_pen = QPen(QColor(c.error), 4)
+        self._dot_brush = QColor(c.error)
+        self._text_color = QColor(c.text_primary)
+        self._time_font = QFont("Arial", 24, QFont.Bold)
+        
+        # Static clock face (circle + hour markers), rendered on first paint
+        self._face_pixmap: Optional[QPixmap] = None
+    
+    def resizeEvent(self, event):
+        """Drop the cached clock face; it is redrawn at the new size."""
+        self._face_pixmap = None
+        super().resizeEvent(event)
+    
+    def _render_face(self) -> QPixmap:
+        """Draw the clock circle and hour markers into a transparent pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        center_x, center_y, radius = self._geometry()
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Clock circle
+        painter.setPen(self._circle_pen)
+        painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
+        
+        # Hour markers
+        painter.setPen(self._marker_pen)
+        outer_r = radius * 0.9
+        inner_r = radius * 0.8
+        for cos_a, sin_a in _HOUR_MARKER_TRIG:
+            outer_x = center_x + int(outer_r * cos_a)
+            outer_y = center_y - int(outer_r * sin_a)
+            inner_x = center_x + int(inner_r * cos_a)
+            inner_y = center_y - int(inner_r * sin_a)
+            painter.drawLine(inner_x, inner_y, outer_x, outer_y)
+        
+        painter.end()
+        return pixmap
+    
+    def _geometry(self):
+        """Get clock center and radius for the current widget size.
+        
+        Returns:
+            (center_x, center_y, radius)
+        """
+        width = self.width()
+        height = self.height()
+        return width // 2, height // 2, min(width, height) // 2 - 20
+    
+    def _text_rect(self, center_y: int, radius: int) -> QRect:
+        """Get the rectangle the remaining-time text is drawn in."""
+        return QRect(0, center_y + radius - 50, self.width(), 40)
+    
+    def _face_state(self, remaining_seconds: int, total_seconds: int) -> tuple:
+        """Get the values that decide how the arc and minute hand are drawn."""
+        progress = (remaining_seconds / total_seconds) if total_seconds > 0 else 0
+        return (int(360 * 16 * progress), (remaining_seconds // 60) % 60)
     
     def set_remaining(self, seconds: int, total_seconds: int = None):
         """Update remaining time.
         
+        Repaints only the time text when the arc and minute hand look the
+        same as before (e.g. long limits, where the arc moves slower than 1/s).
+        
         Args:
             seconds: Remaining seconds
             total_seconds: Total seconds (optional)
         """
+        old_state = self._face_state(self.remaining_seconds, self.total_seconds)
+        old_seconds = self.remaining_seconds
+        
         self.remaining_seconds = seconds
         if total_seconds is not None:
             self.total_seconds = total_seconds
-        self.update()
+        
+        if self._face_state(self.remaining_seconds, self.total_seconds) != old_state:
+            self.update()
+        elif seconds != old_seconds:
+            _, center_y, radius = self._geometry()
+            self.update(self._text_rect(center_y, radius))
     
     def paintEvent(self, event):
         """Paint the analog clock."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Get widget dimensions
-        width = self.width()
-        height = self.height()
-        size = min(width, height)
-        
         # Calculate center and radius
-        center_x = width // 2
-        center_y = height // 2
-        radius = size // 2 - 20
-        
-        # Draw clock circle
-        border_color = QColor(self.theme_colors.border)
-        painter.setPen(QPen(border_color, 3))
-        painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
+        center_x, center_y, radius = self._geometry()
         
-        # Draw filled arc showing remaining time
-        progress = (self.remaining_seconds / self.total_seconds) if self.total_seconds > 0 else 0
-        span_angle = int(360 * 16 * progress)  # Qt uses 16ths of a degree
+        # Draw filled arc showing remaining time (Qt uses 16ths of a degree)
+        span_angle, minute_index = self._face_state(self.remaining_seconds, self.total_seconds)
         
-        accent = QColor(self.theme_colors.accent)
-        accent.setAlpha(120)
-        painter.setBrush(accent)
+        painter.setBrush(self._arc_brush)
         painter.setPen(Qt.NoPen)
         painter.drawPie(center_x - radius, center_y - radius, radius * 2, radius * 2, 90 * 16, -span_angle)
         
-        # Draw hour markers
-        painter.setPen(QPen(QColor(self.theme_colors.text_primary), 2))
-        for i in range(12):
-            angle = i * 30  # 30 degrees per hour
-            outer_x = center_x + int(radius * 0.9 * self._cos(angle))
-            outer_y = center_y - int(radius * 0.9 * self._sin(angle))
-            inner_x = center_x + int(radius * 0.8 * self._cos(angle))
-            inner_y = center_y - int(radius * 0.8 * self._sin(angle))
-            painter.drawLine(inner_x, inner_y, outer_x, outer_y)
-        
-        # Draw hand showing remaining time
-        minutes = self.remaining_seconds // 60
-        seconds = self.remaining_seconds % 60
+        # Clock circle and hour markers from the cached face
+        if self._face_pixmap is None:
+            self._face_pixmap = self._render_face()
+        painter.drawPixmap(0, 0, self._face_pixmap)
         
-        # Minute hand
-        minute_angle = (minutes % 60) * 6  # 6 degrees per minute
+        # Minute hand showing remaining time (6 degrees per minute); skipped
+        # on text-only repaints that don't reach the hand or center dot
+        cos_a, sin_a = _MINUTE_HAND_TRIG[minute_index]
         hand_length = radius * 0.7
-        hand_x = center_x + int(hand_length * self._cos(minute_angle - 90))
-        hand_y = center_y - int(hand_length * self._sin(minute_angle - 90))
-        painter.setPen(QPen(QColor(self.theme_colors.error), 4))
-        painter.drawLine(center_x, center_y, hand_x, hand_y)
-        
-        # Center dot
-        painter.setBrush(QColor(self.theme_colors.error))
-        painter.drawEllipse(center_x - 5, center_y - 5, 10, 10)
+        hand_x = center_x + int(hand_length * cos_a)
+        hand_y = center_y - int(hand_length * sin_a)
+        hand_rect = QRect(QPoint(center_x, center_y), QPoint(hand_x, hand_y)).normalized().adjusted(-5, -5, 5, 5)
+        if event.region().intersects(hand_rect):
+            painter.setPen(self._hand_pen)
+            painter.drawLine(center_x, center_y, hand_x, hand_y)
+            
+            # Center dot
+            painter.setBrush(self._dot_brush)
+            painter.drawEllipse(center_x - 5, center_y - 5, 10, 10)
         
         # Draw time text
         minutes_left = self.remaining_seconds // 60
         seconds_left = self.remaining_seconds % 60
         time_text = f"{minutes_left:02d}:{seconds_left:02d}"
         
-        painter.setPen(QColor(self.theme_colors.text_primary))
-        painter.setFont(QFont("Arial", 24, QFont.Bold))
-        text_rect = QRect(0, center_y + radius - 50, width, 40)
-        painter.drawText(text_rect, Qt.AlignCenter, time_text)
-    
-    def _cos(self, angle_degrees: float) -> float:
-        """Calculate cosine (angle in degrees)."""
-        import math
-        return math.cos(math.radians(angle_degrees))
-    
-    def _sin(self, angle_degrees: float) -> float:
-        """Calculate sine (angle in degrees)."""
-        import math
-        return math.sin(math.radians(angle_degrees))
+        painter.setPen(self._text_color)
+        painter.setFont(self._time_font)
+        painter.drawText(self._text_rect(center_y, radius), Qt.AlignCenter, time_text)
 
 
 class ReminderDialog(QDialog):
@@ -336,9 +396,17 @@ class ScreenTimeManager(QWidget):
         
         self.start_time: Optional[datetime] = None
         self.elapsed_seconds = 0
+        
+        # Session time comes from a monotonic clock, not from counting ticks
+        # (a busy event loop delays ticks); paused time and time added back
+        # via add_time() are excluded
+        self._clock = QElapsedTimer()
+        self._excluded_ms = 0
+        self._pause_started_ms: Optional[int] = None
         self.is_paused = False
         self.is_locked = False
         self.theme: Optional[Theme] = None
+        self._last_emitted = (-1, -1)  # Last (remaining, total) sent via time_updated
         
         self.load_settings()
     
@@ -350,16 +418,15 @@ class ScreenTimeManager(QWidget):
         """Load screentime settings from JSON."""
 
         try:
-            with open(self.settings_path) as f:
-                settings = json.load(f)
-                st = settings.get("screentime", {})
-                
-                self.enabled = st.get("enabled", False)
-                self.limit_minutes = st.get("limit_minutes", 60)
-                self.reminders = st.get("reminders", [30, 5])  # Minutes before end
-                self.pin_code = settings.get("parental", {}).get("pin_code", "1234")
-                
-                self.shown_reminders = set()
+            settings = get_settings(self.settings_path)
+            st = settings.get("screentime", {})
+            
+            self.enabled = st.get("enabled", False)
+            self.limit_minutes = st.get("limit_minutes", 60)
+            self.reminders = st.get("reminders", [30, 5])  # Minutes before end
+            self.pin_code = settings.get("parental", {}).get("pin_code", "1234")
+            
+            self.shown_reminders = set()
         except Exception as e:
             print(f"Error loading screentime settings: {e}")
             self.enabled = False
@@ -367,6 +434,10 @@ class ScreenTimeManager(QWidget):
             self.reminders = [30, 5]
             self.pin_code = "1234"
             self.shown_reminders = set()
+        
+        # Checked every tick, so keep a hashed copy and the limit in seconds
+        self._reminders_set = frozenset(self.reminders)
+        self._limit_seconds = self.limit_minutes * 60
     
     def start(self):
         """Start screen time tracking."""
@@ -390,15 +461,22 @@ class ScreenTimeManager(QWidget):
         
         # Set limit to remaining time for today
         self.limit_minutes = min(self.limit_minutes, remaining_minutes)
+        self._limit_seconds = self.limit_minutes * 60
         
         self.start_time = datetime.now()
         self.elapsed_seconds = 0
+        self._clock.start()
+        self._excluded_ms = 0
+        self._pause_started_ms = None
+        self._last_emitted = (-1, -1)
         self.shown_reminders.clear()
         self.timer.start(1000)  # Update every second
     
     def stop(self):
         """Stop screen time tracking."""
         was_running = self.timer.isActive()
+        if was_running:
+            self.elapsed_seconds = self._session_elapsed_ms() // 1000
         
         # Save used time if timer was running
         if was_running and self.elapsed_seconds > 0:
@@ -415,33 +493,49 @@ class ScreenTimeManager(QWidget):
     
     def pause(self):
         """Pause timer."""
+        if not self.is_paused and self._clock.isValid():
+            self._pause_started_ms = self._clock.elapsed()
         self.is_paused = True
     
     def resume(self):
         """Resume timer."""
+        if self._pause_started_ms is not None:
+            self._excluded_ms += self._clock.elapsed() - self._pause_started_ms
+            self._pause_started_ms = None
         self.is_paused = False
     
+    def _session_elapsed_ms(self) -> int:
+        """Get counted session time in milliseconds (frozen while paused)."""
+        if not self._clock.isValid():
+            return 0
+        now = self._pause_started_ms if self._pause_started_ms is not None else self._clock.elapsed()
+        return now - self._excluded_ms
+    
     def _on_timer_tick(self):
         """Handle timer tick (every second)."""
         if self.is_paused or self.is_locked:
             return
         
-        self.elapsed_seconds += 1
-        remaining_seconds = (self.limit_minutes * 60) - self.elapsed_seconds
-        total_seconds = self.limit_minutes * 60
+        # Read each attribute once per tick
+        elapsed = self._session_elapsed_ms() // 1000
+        self.elapsed_seconds = elapsed
+        total_seconds = self._limit_seconds
+        remaining_seconds = total_seconds - elapsed
         
-        # Emit signal for UI updates
-        self.time_updated.emit(remaining_seconds, total_seconds)
+        # Emit signal for UI updates (only when the shown time changes)
+        payload = (remaining_seconds, total_seconds)
+        if payload != self._last_emitted:
+            self._last_emitted = payload
+            self.time_updated.emit(remaining_seconds, total_seconds)
         
         # Check for reminders (skip first 5 seconds to avoid false triggers on startup)
-        if self.elapsed_seconds >= 5:
+        if elapsed >= 5:
             remaining_minutes = remaining_seconds // 60
+            shown = self.shown_reminders
             
-            for reminder_minutes in self.reminders:
-                if remaining_minutes == reminder_minutes and reminder_minutes not in self.shown_reminders:
-                    self.shown_reminders.add(reminder_minutes)
-                    self._show_reminder(reminder_minutes)
-                    break
+            if remaining_minutes in self._reminders_set and remaining_minutes not in shown:
+                shown.add(remaining_minutes)
+                self._show_reminder(remaining_minutes)
         
         # Check if time is up
         if remaining_seconds <= 0:
@@ -482,7 +576,7 @@ class ScreenTimeManager(QWidget):
         Returns:
             Remaining seconds
         """
-        remaining_seconds = (self.limit_minutes * 60) - self.elapsed_seconds
+        remaining_seconds = self._limit_seconds - self.elapsed_seconds
         if remaining_seconds < 0:
             remaining_seconds = 0
         
@@ -502,12 +596,7 @@ class ScreenTimeManager(QWidget):
         Args:
             minutes: Minutes to add
         """
-        # Reduce elapsed seconds to add time
-        self.elapsed_seconds -= (minutes * 60)
-        if self.elapsed_seconds < 0:
-            self.elapsed_seconds = 0
-    
-    def stop(self):
-        """Stop the screen time timer."""
-        self.timer.stop()
-        self.timer_stopped.emit()
+        # Reduce elapsed time to add time (never below zero)
+        elapsed_ms = self._session_elapsed_ms()
+        self._excluded_ms += min(minutes * 60 * 1000, elapsed_ms)
+        self.elapsed_seconds = self._session_elapsed_ms() // 1000
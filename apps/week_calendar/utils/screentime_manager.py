@@ -7,13 +7,39 @@ Manages:
 - PIN-protected access outside allowed times
 """
 
+import functools
 import json
+import os
 from pathlib import Path
 from datetime import datetime, date, time
 from typing import Dict, Tuple, Optional
 
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QTimer
+
+from utils.fast_json import json_dumps_bytes
+from utils.settings_cache import get_settings
+
+
+# Settings keys for date.weekday() 0-6
+_WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday",
+                  "friday", "saturday", "sunday")
+
+# Usage window applied to days without an explicit entry
+_DEFAULT_USAGE_TIMES = {"start": "00:00", "end": "23:59"}
+_DEFAULT_USAGE_BOUNDS = (0, 23 * 60 + 59)  # Minutes of day
+
+
+def _hhmm_to_minutes(value: str) -> int:
+    """Convert an "HH:MM" string to minutes since midnight."""
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+@functools.lru_cache(maxsize=32)
+def _date_key(target_date: date) -> str:
+    """Get the screentime_data key for a date (the same few days recur)."""
+    return target_date.isoformat()
 
 
 class ScreenTimeController(QWidget):
@@ -32,30 +58,63 @@ class ScreenTimeController(QWidget):
         self.settings_path = Path(__file__).parent.parent / "config" / "settings.json"
         self.screentime_data_path = Path(__file__).parent.parent / "config" / "screentime_data.json"
         
+        # Coalesce bursts of usage/credit changes into one write; _dirty marks
+        # in-memory changes that have not reached the file yet
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self._write_screentime_data)
+        
         self.load_settings()
         self.load_screentime_data()
     
     def load_settings(self):
         """Load screentime settings from config."""
         try:
-            with open(self.settings_path) as f:
-                settings = json.load(f)
-                st = settings.get("screentime", {})
-                
-                self.enabled = st.get("enabled", False)
-                self.allowed_time_mode = st.get("allowed_time_mode", "daily")
-                self.daily_allowed_minutes = st.get("daily_allowed_minutes", 30)
-                self.weekly_allowed_minutes = st.get("weekly_allowed_minutes", {})
-                self.calendar_category = st.get("calendar_category", "Screentime")
-                
-                self.usage_times_mode = st.get("usage_times_mode", "always")
-                self.daily_usage_times = st.get("daily_usage_times", {"start": "00:00", "end": "23:59"})
-                self.weekly_usage_times = st.get("weekly_usage_times", {})
+            settings = get_settings(self.settings_path)
+            st = settings.get("screentime", {})
+            
+            self.enabled = st.get("enabled", False)
+            self.allowed_time_mode = st.get("allowed_time_mode", "daily")
+            self.daily_allowed_minutes = st.get("daily_allowed_minutes", 30)
+            self.weekly_allowed_minutes = st.get("weekly_allowed_minutes", {})
+            self.calendar_category = st.get("calendar_category", "Screentime")
+            
+            self.usage_times_mode = st.get("usage_times_mode", "always")
+            self.daily_usage_times = st.get("daily_usage_times", {"start": "00:00", "end": "23:59"})
+            self.weekly_usage_times = st.get("weekly_usage_times", {})
+            
+            self._weekly_usage_bounds = self._parse_usage_bounds(self.weekly_usage_times)
         except Exception as e:
             print(f"Error loading screentime settings: {e}")
             self.enabled = False
             self.allowed_time_mode = "daily"
             self.daily_allowed_minutes = 30
+            self._weekly_usage_bounds = {}
+    
+    @staticmethod
+    def _parse_usage_bounds(usage_times: dict) -> dict:
+        """Parse per-day usage windows into (start, end) minutes of day.
+        
+        Parsed once here; is_within_usage_times runs on every session start
+        and then only compares integers. A malformed window is reported and
+        skipped (that day falls back to the default window) without
+        affecting the other days or disabling enforcement.
+        
+        Args:
+            usage_times: Mapping of weekday name to {"start": "HH:MM", "end": "HH:MM"}
+            
+        Returns:
+            Mapping of weekday name to (start_minute, end_minute)
+        """
+        bounds = {}
+        for day, times in usage_times.items():
+            try:
+                bounds[day] = (_hhmm_to_minutes(times["start"]), _hhmm_to_minutes(times["end"]))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                print(f"Ignoring invalid usage time for {day}: {e}")
+        return bounds
     
     def load_screentime_data(self):
         """Load screentime usage data (used minutes per day)."""
@@ -70,11 +129,24 @@ class ScreenTimeController(QWidget):
             self.screentime_data = {}
     
     def save_screentime_data(self):
-        """Save screentime usage data."""
+        """Mark usage data changed and schedule a save (debounced)."""
+        self._dirty = True
+        self._save_timer.start()
+    
+    def flush_screentime_data(self):
+        """Write unsaved changes immediately (e.g. on application exit)."""
+        self._save_timer.stop()
+        if self._dirty:
+            self._write_screentime_data()
+    
+    def _write_screentime_data(self):
+        """Write screentime usage data via a temp file and atomic rename."""
+        tmp_path = self.screentime_data_path.with_suffix('.tmp')
         try:
             self.screentime_data_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.screentime_data_path, 'w') as f:
-                json.dump(self.screentime_data, f, indent=2)
+            tmp_path.write_bytes(json_dumps_bytes(self.screentime_data, indent=True))
+            os.replace(tmp_path, self.screentime_data_path)
+            self._dirty = False
         except Exception as e:
             print(f"Error saving screentime data: {e}")
     
@@ -91,9 +163,7 @@ class ScreenTimeController(QWidget):
             return self.daily_allowed_minutes
         
         elif self.allowed_time_mode == "weekly":
-            weekday_names = ["monday", "tuesday", "wednesday", "thursday", 
-                           "friday", "saturday", "sunday"]
-            weekday = weekday_names[target_date.weekday()]
+            weekday = _WEEKDAY_NAMES[target_date.weekday()]
             return self.weekly_allowed_minutes.get(weekday, 30)
         
         elif self.allowed_time_mode == "calendar":
@@ -112,7 +182,7 @@ class ScreenTimeController(QWidget):
         Returns:
             Used minutes for that day
         """
-        date_str = target_date.isoformat()
+        date_str = _date_key(target_date)
         return self.screentime_data.get(date_str, {}).get("used_minutes", 0)
     
     def get_remaining_minutes_for_day(self, target_date: date) -> int:
@@ -128,7 +198,7 @@ class ScreenTimeController(QWidget):
         used = self.get_used_minutes_for_day(target_date)
         
         # Add any credits for this day
-        date_str = target_date.isoformat()
+        date_str = _date_key(target_date)
         credits = self.screentime_data.get(date_str, {}).get("credits", 0)
         
         return max(0, allowed + credits - used)
@@ -143,7 +213,7 @@ class ScreenTimeController(QWidget):
         if target_date is None:
             target_date = date.today()
         
-        date_str = target_date.isoformat()
+        date_str = _date_key(target_date)
         
         if date_str not in self.screentime_data:
             self.screentime_data[date_str] = {"used_minutes": 0, "credits": 0}
@@ -158,7 +228,7 @@ class ScreenTimeController(QWidget):
             minutes: Minutes to credit
             target_date: Target date
         """
-        date_str = target_date.isoformat()
+        date_str = _date_key(target_date)
         
         if date_str not in self.screentime_data:
             self.screentime_data[date_str] = {"used_minutes": 0, "credits": 0}
@@ -185,18 +255,15 @@ class ScreenTimeController(QWidget):
             return (True, None)
         
         elif self.usage_times_mode == "weekly":
-            weekday_names = ["monday", "tuesday", "wednesday", "thursday", 
-                           "friday", "saturday", "sunday"]
-            weekday = weekday_names[check_time.weekday()]
-            times = self.weekly_usage_times.get(weekday, {"start": "00:00", "end": "23:59"})
-            
-            start_time = datetime.strptime(times["start"], "%H:%M").time()
-            end_time = datetime.strptime(times["end"], "%H:%M").time()
-            current_time = check_time.time()
+            weekday = _WEEKDAY_NAMES[check_time.weekday()]
+            bounds = self._weekly_usage_bounds.get(weekday)
+            start_minute, end_minute = bounds or _DEFAULT_USAGE_BOUNDS
+            current_minute = check_time.hour * 60 + check_time.minute
             
-            if start_time <= current_time <= end_time:
+            if start_minute <= current_minute < end_minute:
                 return (True, None)
             else:
+                times = self.weekly_usage_times[weekday] if bounds else _DEFAULT_USAGE_TIMES
                 return (False, f"Außerhalb der erlaubten Nutzungszeit ({times['start']} - {times['end']})")
         
         elif self.usage_times_mode == "calendar":
@@ -0,0 +1,56 @@
+"""
+Shared, parsed view of config/settings.json.
+
+Several components read the same settings file at startup; this parses it
+once and hands every caller the same dict until the file changes on disk
+(or invalidate() is called after writing it).
+
+Usage:
+    from utils.settings_cache import get_settings, invalidate
+
+    st = get_settings(settings_path).get("screentime", {})
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+from utils.fast_json import json_loads
+
+
+_lock = threading.Lock()
+_cache: Dict[Path, Tuple[int, dict]] = {}  # resolved path -> (mtime_ns, settings)
+
+
+def get_settings(settings_path: Path) -> dict:
+    """Return parsed settings, re-reading only when the file's mtime changed.
+
+    The returned dict is shared between callers and must not be modified.
+
+    Args:
+        settings_path: Path to settings.json
+
+    Returns:
+        Parsed settings dictionary
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    path = Path(settings_path).resolve()
+    mtime = path.stat().st_mtime_ns
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    settings = json_loads(path.read_bytes())
+    with _lock:
+        _cache[path] = (mtime, settings)
+    return settings
+
+
+def invalidate():
+    """Forget all cached settings (call after writing settings.json)."""
+    with _lock:
+        _cache.clear()
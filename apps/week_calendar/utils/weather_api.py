@@ -6,8 +6,17 @@ Documentation: https://open-meteo.com/
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from utils.fast_json import json_loads
+
+
+# One pooled session so forecast and geocoding calls keep their connections
+# to *.open-meteo.com open instead of redoing the TCP/TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 
 class WeatherAPI:
@@ -36,26 +45,51 @@ class WeatherAPI:
         Returns:
             List of weather dictionaries with date, icon, temperatures, description
         """
+        location = (self.latitude, self.longitude, self.timezone)
+        return self.fetch_forecast_batch([location], days)[0]
+    
+    @classmethod
+    def fetch_forecast_batch(cls, locations: List[Tuple[float, float, str]],
+                             days: int = 7) -> List[List[Dict]]:
+        """Fetch forecasts for several locations in a single request.
+        
+        Open-Meteo accepts comma-separated coordinate lists and answers with
+        one forecast block per location, in the same order.
+        
+        Args:
+            locations: List of (latitude, longitude, timezone) tuples
+            days: Number of days to forecast (max 16)
+            
+        Returns:
+            One list of weather dictionaries per location (see fetch_forecast)
+        """
+        if not locations:
+            return []
+        
         try:
             params = {
-                'latitude': self.latitude,
-                'longitude': self.longitude,
+                'latitude': ','.join(str(loc[0]) for loc in locations),
+                'longitude': ','.join(str(loc[1]) for loc in locations),
                 'daily': 'temperature_2m_max,temperature_2m_min,weathercode',
-                'timezone': self.timezone,
+                'timezone': ','.join(loc[2] for loc in locations),
                 'forecast_days': min(days, 16)  # Open-Meteo supports up to 16 days
             }
             
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = _SESSION.get(cls.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            return self._parse_forecast(data)
+            data = json_loads(response.content)
+            # A single location comes back as an object, several as an array
+            if isinstance(data, dict):
+                data = [data]
+            return [cls._parse_forecast(block) for block in data]
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching weather data: {e}")
-            return self._get_fallback_forecast(days)
+            return [cls._get_fallback_forecast(days) for _ in locations]
     
-    def _parse_forecast(self, data: Dict) -> List[Dict]:
+    @classmethod
+    def _parse_forecast(cls, data: Dict) -> List[Dict]:
         """Parse Open-Meteo API response into our format.
         
         Args:
@@ -73,7 +107,7 @@ class WeatherAPI:
         weather_codes = daily.get('weathercode', [])
         
         for i, date_str in enumerate(dates):
-            icon, description = self._get_icon_and_description(weather_codes[i])
+            icon, description = cls._get_icon_and_description(weather_codes[i])
             
             forecasts.append({
                 'date': date_str,
@@ -85,7 +119,8 @@ class WeatherAPI:
         
         return forecasts
     
-    def _get_icon_and_description(self, weather_code: int) -> tuple:
+    @staticmethod
+    def _get_icon_and_description(weather_code: int) -> tuple:
         """Map WMO weather code to icon and description.
         
         WMO Weather interpretation codes:
@@ -123,7 +158,8 @@ class WeatherAPI:
         else:
             return "cloudy.png", "Cloudy"
     
-    def _get_fallback_forecast(self, days: int) -> List[Dict]:
+    @staticmethod
+    def _get_fallback_forecast(days: int) -> List[Dict]:
         """Generate fallback weather data when API is unavailable.
         
         Args:
@@ -190,10 +226,10 @@ class WeatherAPI:
                 'format': 'json'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = _SESSION.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             results = data.get('results', [])
             
             if results:
@@ -206,7 +242,7 @@ class WeatherAPI:
             
             return None
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Error geocoding city: {e}")
             return None
     
@@ -230,10 +266,10 @@ class WeatherAPI:
                 'format': 'json'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = _SESSION.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             results = data.get('results', [])
             
             locations = []
@@ -256,7 +292,7 @@ class WeatherAPI:
             
             return locations
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Error searching locations: {e}")
             return []
 
@@ -271,10 +307,9 @@ def fetch_and_cache_weather(database, weather_api: WeatherAPI, days: int = 14):
     """
     forecasts = weather_api.fetch_forecast(days)
     
-    for forecast in forecasts:
-        database.cache_weather(forecast)
+    count = database.cache_weather_bulk(forecasts)
     
-    print(f"Cached {len(forecasts)} days of weather data")
+    print(f"Cached {count} days of weather data")
 
 
 if __name__ == "__main__":
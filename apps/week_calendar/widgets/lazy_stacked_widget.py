@@ -0,0 +1,107 @@
+"""Stacked widget whose pages are built on first access."""
+
+from typing import Callable, Dict, Optional
+
+from PyQt5.QtWidgets import QWidget, QStackedWidget
+from PyQt5.QtCore import pyqtSignal
+
+
+class LazyStackedWidget(QStackedWidget):
+    """QStackedWidget that materializes registered pages on demand.
+    
+    Pages added with addLazyWidget() occupy their slot with an empty
+    placeholder until they are first shown (or requested via lazyWidget()),
+    at which point the factory is called and the real widget takes the
+    placeholder's index. Indices therefore stay stable across materialization.
+    """
+    
+    widget_created = pyqtSignal(str, QWidget)  # Emits key and new widget
+    
+    def __init__(self, parent=None):
+        """Initialize lazy stacked widget.
+        
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        
+        self._factories: Dict[str, Callable[[], QWidget]] = {}
+        self._placeholders: Dict[str, QWidget] = {}
+        self._widgets: Dict[str, QWidget] = {}
+    
+    def addLazyWidget(self, key: str, factory: Callable[[], QWidget]) -> int:
+        """Register a page that is built by factory on first access.
+        
+        Args:
+            key: Name used to look the page up later
+            factory: Zero-argument callable returning the page widget
+        
+        Returns:
+            Index of the page in the stack
+        """
+        placeholder = QWidget()
+        self._factories[key] = factory
+        self._placeholders[key] = placeholder
+        return self.addWidget(placeholder)
+    
+    def hasLazyWidget(self, key: str) -> bool:
+        """Check whether a lazy page is registered under key."""
+        return key in self._factories
+    
+    def isMaterialized(self, key: str) -> bool:
+        """Check whether the page for key has been built yet."""
+        return key in self._widgets
+    
+    def lazyWidget(self, key: str) -> QWidget:
+        """Return the page registered under key, building it if needed.
+        
+        Args:
+            key: Name the page was registered with
+        
+        Returns:
+            The materialized page widget
+        """
+        widget = self._widgets.get(key)
+        if widget is None:
+            widget = self._materialize(key)
+        return widget
+    
+    def setCurrentIndex(self, index: int):
+        """Show the page at index, building it first if it is a placeholder."""
+        key = self._key_for_placeholder(self.widget(index))
+        if key is not None:
+            self._materialize(key)
+        super().setCurrentIndex(index)
+    
+    def setCurrentWidget(self, widget: QWidget):
+        """Show widget, building it first if it is a placeholder."""
+        key = self._key_for_placeholder(widget)
+        if key is not None:
+            widget = self._materialize(key)
+        super().setCurrentWidget(widget)
+    
+    def _key_for_placeholder(self, widget: Optional[QWidget]) -> Optional[str]:
+        """Return the key whose placeholder is widget, if any."""
+        if widget is None:
+            return None
+        for key, placeholder in self._placeholders.items():
+            if placeholder is widget:
+                return key
+        return None
+    
+    def _materialize(self, key: str) -> QWidget:
+        """Build the page for key and swap it in for its placeholder."""
+        placeholder = self._placeholders.pop(key)
+        index = self.indexOf(placeholder)
+        was_current = self.currentWidget() is placeholder
+        
+        widget = self._factories[key]()
+        self.insertWidget(index, widget)
+        self.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if was_current:
+            super().setCurrentIndex(index)
+        
+        self._widgets[key] = widget
+        self.widget_created.emit(key, widget)
+        return widget
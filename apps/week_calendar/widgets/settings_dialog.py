@@ -6,6 +6,7 @@ Includes weather location, year view options, sync settings, etc.
 """
 
 import json
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Optional
 
@@ -18,7 +19,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont
 
-from utils.location import get_location_from_ip
+from utils import settings_cache
+from utils.location import get_cached_location, get_location_from_ip_async
 from utils.weather_api import WeatherAPI
 from utils.i18n import t, set_language, get_available_languages
 from themes.theme_manager import get_theme_manager, Theme, ThemeColors
@@ -35,6 +37,7 @@ class SettingsDialog(QWidget):
     REPO_URL = "https://github.com/4maggio/Kinderkuchen"
     WEATHER_PROVIDER_URL = "https://open-meteo.com/"
     ARTWORK_CREDIT = "mochi_024"
+    LOCATION_DETECT_TIMEOUT = 3.0  # seconds
     
     def __init__(self, database, parent=None, theme: Optional[Theme] = None):
         """Initialize settings view.
@@ -77,6 +80,13 @@ class SettingsDialog(QWidget):
             self.authenticated = True
             self._init_ui()
     
+    def refresh(self):
+        """No-op; the settings page holds no database-backed content.
+        
+        Present so the main window can refresh whatever page is current
+        without probing for the method.
+        """
+    
     def _load_settings(self) -> dict:
         """Load settings from JSON file.
         
@@ -216,6 +226,7 @@ class SettingsDialog(QWidget):
             self.settings_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.settings_path, 'w') as f:
                 json.dump(self.settings, f, indent=2)
+            settings_cache.invalidate()
             print("Settings saved successfully")
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -1721,7 +1732,14 @@ class SettingsDialog(QWidget):
     
     def _detect_location(self):
         """Detect location from IP address."""
-        location = get_location_from_ip()
+        # Usually already resolved by the prefetch started at app launch;
+        # if ip-api is slow, use the last known location instead of freezing
+        try:
+            location = get_location_from_ip_async().result(
+                timeout=self.LOCATION_DETECT_TIMEOUT
+            )
+        except FutureTimeoutError:
+            location = get_cached_location()
         
         if location:
             lat, lon, city, tz = location